@@ -0,0 +1,38 @@
+"""add_unique_constraints_for_snapshot_and_health_upserts
+
+Revision ID: a7d31c59e208
+Revises: e34f9c9bf6e5
+Create Date: 2026-08-29 10:42:11.206833
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d31c59e208'
+down_revision: Union[str, None] = 'e34f9c9bf6e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'uq_index_snapshots_lane_date_index',
+        'index_snapshots',
+        ['trade_lane_id', 'date', 'index_type'],
+    )
+    op.create_unique_constraint(
+        'uq_lane_health_lane_week',
+        'lane_health',
+        ['trade_lane_id', 'week_start'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_lane_health_lane_week', 'lane_health', type_='unique')
+    op.drop_constraint(
+        'uq_index_snapshots_lane_date_index', 'index_snapshots', type_='unique'
+    )
@@ -0,0 +1,28 @@
+"""index events.date_observed for week-window scans
+
+Revision ID: c51036d3899b
+Revises: a7d31c59e208
+Create Date: 2026-08-29 12:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c51036d3899b'
+down_revision: Union[str, None] = 'a7d31c59e208'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_events_date_observed'), 'events', ['date_observed'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_events_date_observed'), table_name='events')
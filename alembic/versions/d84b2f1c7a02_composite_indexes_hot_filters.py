@@ -0,0 +1,56 @@
+"""composite indexes on hot dashboard filter columns
+
+Revision ID: d84b2f1c7a02
+Revises: c51036d3899b
+Create Date: 2026-08-29 12:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd84b2f1c7a02'
+down_revision: Union[str, None] = 'c51036d3899b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_events_lane_date_index',
+        'events',
+        ['trade_lane_id', 'date_observed', 'index_impact'],
+        unique=False,
+    )
+    # Partial index: the reviewed-only filter matches few rows, so indexing
+    # just those keeps the index tiny. Ignored by dialects other than
+    # PostgreSQL.
+    op.create_index(
+        'ix_events_reviewed_true',
+        'events',
+        ['reviewed'],
+        unique=False,
+        postgresql_where=sa.text('reviewed IS TRUE'),
+    )
+    op.create_index(
+        'ix_snapshots_lane_date_type',
+        'index_snapshots',
+        ['trade_lane_id', 'date', 'index_type'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_lane_health_lane_week_end',
+        'lane_health',
+        ['trade_lane_id', 'week_end'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lane_health_lane_week_end', table_name='lane_health')
+    op.drop_index('ix_snapshots_lane_date_type', table_name='index_snapshots')
+    op.drop_index('ix_events_reviewed_true', table_name='events')
+    op.drop_index('ix_events_lane_date_index', table_name='events')
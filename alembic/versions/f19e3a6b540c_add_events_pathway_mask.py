@@ -0,0 +1,26 @@
+"""add events.pathway_mask packed pathway bits
+
+Revision ID: f19e3a6b540c
+Revises: d84b2f1c7a02
+Create Date: 2026-08-29 13:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19e3a6b540c'
+down_revision: Union[str, None] = 'd84b2f1c7a02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('pathway_mask', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'pathway_mask')
@@ -9,6 +9,7 @@ Also handles Windows + Python 3.14 SQLAlchemy C-extension runtime issues.
 
 import argparse
 import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
@@ -20,7 +21,8 @@ if sys.platform == "win32" and sys.version_info >= (3, 14):
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 
-def parse_args() -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Bootstrap Advuman database")
     parser.add_argument(
         "--local",
@@ -32,7 +34,11 @@ def parse_args() -> argparse.Namespace:
         default="advuman_local.db",
         help="SQLite file path used with --local (default: advuman_local.db)",
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    return _build_parser().parse_args()
 
 
 def configure_local_database(sqlite_path: str) -> Path:
@@ -49,59 +55,53 @@ def run_migrations() -> None:
         raise SystemExit(result)
 
 
-def run_seed() -> None:
-    from src.db.seed import main as seed_main
-
-    asyncio.run(seed_main())
-
-
-def run_local_schema_create() -> None:
-    from sqlalchemy.ext.asyncio import create_async_engine
-
-    from src.config import settings
-    from src.db.engine import get_async_engine_options
-    from src.db.models import Base
+async def run_migrations_async() -> None:
+    """Run the (synchronous) Alembic upgrade without blocking the event loop."""
+    await asyncio.to_thread(run_migrations)
 
-    async def _create() -> None:
-        engine = create_async_engine(
-            settings.database_url, **get_async_engine_options(settings.database_url)
-        )
-        async with engine.begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
-        await engine.dispose()
 
-    asyncio.run(_create())
-
-
-def ensure_schema_exists() -> None:
+async def create_schema() -> None:
+    """Create any missing tables from the models (idempotent)."""
     from sqlalchemy.ext.asyncio import create_async_engine
 
-    from src.config import settings
+    from src.config import get_settings
     from src.db.engine import get_async_engine_options
     from src.db.models import Base
 
-    async def _create() -> None:
-        engine = create_async_engine(
-            settings.database_url, **get_async_engine_options(settings.database_url)
-        )
-        async with engine.begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
-        await engine.dispose()
+    database_url = get_settings().database_url
+    engine = create_async_engine(
+        database_url, **get_async_engine_options(database_url)
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+async def bootstrap_async(args: argparse.Namespace) -> None:
+    """Run schema creation + seed on one event loop.
+
+    A single asyncio.run keeps one driver/pool lifecycle for the whole
+    bootstrap instead of spinning up a fresh loop per step.
+    """
+    if args.local:
+        db_path = configure_local_database(args.sqlite_path)
+        await create_schema()
+        print(f"Local schema ready: {db_path}")
+    else:
+        await run_migrations_async()
+        await create_schema()
+
+    # Imported after DATABASE_URL is finalized — src.db.session binds its
+    # engine to the configured URL at import time.
+    from src.db.seed import main as seed_main
 
-    asyncio.run(_create())
+    await seed_main()
 
 
 if __name__ == "__main__":
     args = parse_args()
     try:
-        if args.local:
-            db_path = configure_local_database(args.sqlite_path)
-            run_local_schema_create()
-            print(f"Local schema ready: {db_path}")
-        else:
-            run_migrations()
-            ensure_schema_exists()
-        run_seed()
+        asyncio.run(bootstrap_async(args))
         print("Database bootstrap complete.")
     except Exception as exc:
         message = str(exc)
@@ -8,20 +8,19 @@ Checks:
 """
 
 import asyncio
-import socket
 import sys
 from pathlib import Path
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.parse import SplitResult, parse_qsl, urlencode, urlsplit, urlunsplit
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import asyncpg
 
-from src.config import settings
+from src.config import get_settings
+from src.dns_cache import install_dns_cache
 
 
-def _masked_url(url: str) -> str:
-    parsed = urlsplit(url)
+def _masked_url(parsed: SplitResult) -> str:
     netloc = parsed.netloc
     if "@" in netloc:
         creds, hostpart = netloc.rsplit("@", 1)
@@ -36,10 +35,9 @@ def _masked_url(url: str) -> str:
     )
 
 
-def _asyncpg_url(url: str) -> str:
-    parsed = urlsplit(url)
+def _asyncpg_url(parsed: SplitResult, query: dict[str, str]) -> str:
     scheme = parsed.scheme.replace("+asyncpg", "")
-    query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+    query = dict(query)
     if query.get("sslmode") == "require" and "ssl" not in query:
         query["ssl"] = "require"
     return urlunsplit(
@@ -47,69 +45,89 @@ def _asyncpg_url(url: str) -> str:
     )
 
 
-def _extract_host_port(url: str) -> tuple[str | None, int]:
-    parsed = urlsplit(url)
+def _extract_host_port(parsed: SplitResult) -> tuple[str | None, int]:
     host = parsed.hostname
     port = parsed.port or 5432
     return host, port
 
 
-def _check_dns(host: str) -> tuple[bool, str]:
+async def _check_dns(host: str) -> tuple[bool, str]:
     try:
-        infos = socket.getaddrinfo(host, None)
+        infos = await asyncio.get_running_loop().getaddrinfo(host, None)
         resolved = sorted({info[4][0] for info in infos})
         return True, ", ".join(resolved[:4])
     except Exception as exc:
         return False, str(exc)
 
 
-def _check_tcp(host: str, port: int, timeout: float = 5.0) -> tuple[bool, str]:
+async def _check_tcp(host: str, port: int, timeout: float = 5.0) -> tuple[bool, str]:
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            return True, f"Connected to {host}:{port}"
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+        writer.close()
+        await writer.wait_closed()
+        return True, f"Connected to {host}:{port}"
     except Exception as exc:
         return False, str(exc)
 
 
-async def _check_asyncpg(url: str) -> tuple[bool, str]:
+async def _check_asyncpg(
+    url: str, pool: "asyncpg.Pool | None" = None
+) -> tuple[bool, str]:
+    """Probe the DB with a trivial query.
+
+    Accepts an optional pre-created pool so repeated probes (e.g. from a retry
+    loop) reuse one TCP+TLS+auth handshake instead of paying it per call.
+    """
     try:
         host = urlsplit(url).hostname or ""
-        connect_kwargs = {"timeout": 10}
+        pool_kwargs = {"min_size": 1, "max_size": 2, "timeout": 10}
         if "pooler.supabase.com" in host:
-            connect_kwargs["statement_cache_size"] = 0
+            pool_kwargs["statement_cache_size"] = 0
 
-        conn = await asyncpg.connect(url, **connect_kwargs)
+        owned = pool is None
+        if owned:
+            pool = await asyncpg.create_pool(url, **pool_kwargs)
         try:
-            value = await conn.fetchval("select 1")
+            async with pool.acquire() as conn:
+                value = await conn.fetchval("select 1")
             return True, f"Query ok (select 1 => {value})"
         finally:
-            await conn.close()
+            if owned:
+                await pool.close()
     except Exception as exc:
         text = str(exc).strip()
         return False, text if text else repr(exc)
 
 
-def main() -> int:
-    url = settings.database_url
-    print("DATABASE_URL:", _masked_url(url))
+async def main() -> int:
+    install_dns_cache()
+    url = get_settings().database_url
+    # Parse once; every helper below works off the same SplitResult.
+    parsed = urlsplit(url)
+    query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+    print("DATABASE_URL:", _masked_url(parsed))
 
-    host, port = _extract_host_port(url)
+    host, port = _extract_host_port(parsed)
     if not host:
         print("[FAIL] Could not parse host from DATABASE_URL")
         return 2
 
     print(f"Parsed host={host}, port={port}")
 
-    ok_dns, dns_msg = _check_dns(host)
-    print("[OK]" if ok_dns else "[FAIL]", "DNS:", dns_msg)
+    # The three probes are independent, so run them concurrently and wait on
+    # max(latency) rather than the sum — the difference matters on bad networks
+    # where each probe can take seconds to time out.
+    pg_url = _asyncpg_url(parsed, query)
+    (ok_dns, dns_msg), (ok_tcp, tcp_msg), (ok_pg, pg_msg) = await asyncio.gather(
+        _check_dns(host),
+        _check_tcp(host, port),
+        _check_asyncpg(pg_url),
+    )
 
-    ok_tcp, tcp_msg = _check_tcp(host, port)
+    print("[OK]" if ok_dns else "[FAIL]", "DNS:", dns_msg)
     print("[OK]" if ok_tcp else "[FAIL]", "TCP:", tcp_msg)
-
-    pg_url = _asyncpg_url(url)
-    parsed = urlsplit(url)
-    query = dict(parse_qsl(parsed.query, keep_blank_values=True))
-    ok_pg, pg_msg = asyncio.run(_check_asyncpg(pg_url))
     print("[OK]" if ok_pg else "[FAIL]", "asyncpg:", pg_msg)
 
     if ok_dns and ok_tcp and ok_pg:
@@ -131,4 +149,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(asyncio.run(main()))
@@ -30,11 +30,11 @@ LANE_NAMES = ["UK-India", "UK-Egypt"]
 
 
 async def ingest_lane(lane_name: str, dry_run: bool) -> dict | None:
-    from src.config import settings
+    from src.config import get_settings
     from src.collectors.sheet_ingestor import SheetIngestor
 
     try:
-        url = settings.sheet_tab_url(lane_name)
+        url = get_settings().sheet_tab_url(lane_name)
     except KeyError:
         log.error(
             "No sheet GID configured for lane '%s'. Check OSINT_SHEET_GIDS in .env",
@@ -270,4 +270,12 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Optional libuv event loop; every scheduled asyncio.run picks it up.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     main()
@@ -3,19 +3,26 @@ import sqlite3
 con = sqlite3.connect("advuman_local.db")
 cur = con.cursor()
 
-print("events=", cur.execute("select count(1) from events").fetchone()[0])
-print(
-    "weighted_scores=",
-    cur.execute("select count(1) from weighted_scores").fetchone()[0],
-)
-print("snapshots=", cur.execute("select count(1) from index_snapshots").fetchone()[0])
-print("lane_health=", cur.execute("select count(1) from lane_health").fetchone()[0])
-print(
-    "this_week_events=",
-    cur.execute(
-        "select count(1) from events where date_observed >= '2026-02-23' and date_observed <= '2026-02-27'"
-    ).fetchone()[0],
-)
+# One statement with scalar subqueries instead of five execute/fetchone
+# round-trips — a single prepare and SQLite VM run returns every count.
+counts = cur.execute(
+    """
+    select
+        (select count(1) from events),
+        (select count(1) from weighted_scores),
+        (select count(1) from index_snapshots),
+        (select count(1) from lane_health),
+        (select count(1) from events where date_observed between ? and ?)
+    """,
+    ("2026-02-23", "2026-02-27"),
+).fetchone()
+events, weighted_scores, snapshots, lane_health, this_week_events = counts
+
+print("events=", events)
+print("weighted_scores=", weighted_scores)
+print("snapshots=", snapshots)
+print("lane_health=", lane_health)
+print("this_week_events=", this_week_events)
 print(
     "latest_health=",
     cur.execute(
@@ -29,7 +29,7 @@ import src.collectors.cpi.forwarder_posts  # noqa: F401
 
 from src.collectors.registry import list_collectors
 from src.collectors.source_config import load_source_overrides
-from src.config import settings
+from src.config import get_settings
 
 
 async def validate(csv_location: str, strict: bool = False) -> int:
@@ -111,7 +111,7 @@ def main() -> None:
     parser.add_argument("--strict", action="store_true", help="Fail on warnings")
     args = parser.parse_args()
 
-    csv_location = args.csv or settings.sources_sheet_csv_url
+    csv_location = args.csv or get_settings().sources_sheet_csv_url
     exit_code = asyncio.run(validate(csv_location, strict=args.strict))
     raise SystemExit(exit_code)
 
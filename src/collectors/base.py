@@ -1,10 +1,15 @@
 """Base collector interface for all OSINT source collectors."""
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import date
-from urllib.parse import urlsplit
+from datetime import date, datetime
+from urllib.parse import urljoin
 
+import httpx
+import lxml.html
+
+from src.collectors import http_cache
 from src.db.models import (
     ConfidenceLevel,
     EventStatus,
@@ -48,26 +53,241 @@ class ClassifiedEvent:
     analyst_notes: str = ""
 
 
-DEFAULT_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    "Accept-Language": "en-GB,en;q=0.9",
-}
+# Cap how much HTML the text extractor parses; when only a short excerpt is
+# kept there is no point building a DOM for a multi-MB page.
+_TEXT_PARSE_CAP = 200_000
+
+
+def extract_text(raw_html: str, limit: int = 2000) -> str:
+    """Extract visible page text straight from the lxml tree, truncated.
+
+    Cheaper than wrapping the document in BeautifulSoup just to call
+    get_text(): lxml's text_content() walks the C-level tree directly.
+    """
+    if not raw_html or not raw_html.strip():
+        return ""
+    if len(raw_html) > _TEXT_PARSE_CAP:
+        raw_html = raw_html[:_TEXT_PARSE_CAP]
+    text = " ".join(lxml.html.fromstring(raw_html).itertext())
+    return " ".join(text.split())[:limit]
+
+
+def absolutize(base: str, href: str) -> str:
+    """Resolve a scraped href against the page it came from.
+
+    Thin wrapper over urljoin, which handles absolute, root-relative and
+    scheme-relative (``//cdn...``) hrefs correctly — unlike the old
+    startswith("http") + f-string concatenation. Empty hrefs pass through
+    so callers' ``or self.source_url`` fallbacks keep working.
+    """
+    if not href:
+        return href
+    return urljoin(base, href)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_iso_date(dt_str: str) -> date:
+    """Parse an ISO-8601 timestamp into a date, memoized.
+
+    Listing pages repeat the same timestamp across many items, so identical
+    strings become a cache hit instead of a full fromisoformat() parse. A
+    trailing "Z" is rewritten to "+00:00" for Python's parser. Raises
+    ValueError on malformed input, like fromisoformat().
+    """
+    if dt_str.endswith("Z"):
+        dt_str = dt_str[:-1] + "+00:00"
+    return datetime.fromisoformat(dt_str).date()
+
+
+# Parsed into httpx.Headers once at import; the client constructor would
+# otherwise re-encode a plain dict every time the shared client is rebuilt.
+DEFAULT_HEADERS = httpx.Headers(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-GB,en;q=0.9",
+    }
+)
+
+
+# Process-wide HTTP client shared by all collectors, so concurrent collections
+# reuse pooled keep-alive connections instead of paying a TCP+TLS handshake
+# per collect() call.
+_shared_client: httpx.AsyncClient | None = None
+
+# HTTP/2 lets the CDN-fronted sources multiplex concurrent requests over one
+# connection; enable it only when the optional h2 package is importable so
+# environments installed without the extra keep working on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared pooled HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=30,
+            follow_redirects=True,
+            headers=DEFAULT_HEADERS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=_HTTP2_AVAILABLE,
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (called by drivers on shutdown)."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+# Download cap for pages where only a short text excerpt is kept; lxml's HTML
+# parser recovers from the truncated markup.
+_STREAM_BYTE_CAP = 131_072
+
+
+async def _stream_capped(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    max_bytes: int,
+) -> str | None:
+    chunks: list[bytes] = []
+    received = 0
+    async with client.stream("GET", url, headers=headers) as resp:
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes(chunk_size=8192):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= max_bytes:
+                break
+        encoding = resp.charset_encoding or "utf-8"
+        http_cache.store_validators(url, resp)
+    return b"".join(chunks).decode(encoding, errors="replace")
+
+
+async def fetch_text_capped(url: str, max_bytes: int = _STREAM_BYTE_CAP) -> str | None:
+    """Fetch at most ``max_bytes`` of a page body as text.
+
+    Collectors that keep only a ~2000-char excerpt have no use for the rest
+    of a multi-hundred-KB page: the response is streamed and the download
+    cut short once the cap is reached. A Range header lets cooperating
+    servers skip sending the tail entirely; servers that reject ranged
+    requests (416) get one plain retry.
+
+    Fetches are also conditional: cached ETag / Last-Modified validators
+    are attached, and a 304 Not Modified returns None so callers can skip
+    parsing an unchanged page.
+    """
+    client = get_shared_client()
+    headers = {"Range": f"bytes=0-{max_bytes - 1}"}
+    headers.update(http_cache.conditional_headers(url))
+    try:
+        return await _stream_capped(client, url, headers, max_bytes)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 416:
+            del headers["Range"]
+            return await _stream_capped(client, url, headers, max_bytes)
+        raise
+
+
+async def conditional_get_tree(url: str) -> lxml.html.HtmlElement | None:
+    """GET a page and stream its bytes straight into lxml's HTML parser.
+
+    Avoids materialising the full decoded body as a Python string before
+    parsing: each network chunk is fed to the C-level parser as it arrives,
+    so peak memory is one chunk plus the tree. Conditional validators are
+    sent as with :func:`conditional_get`; returns None on 304 Not Modified.
+    """
+    client = get_shared_client()
+    parser = lxml.html.HTMLParser()
+    fed = False
+    async with client.stream(
+        "GET", url, headers=http_cache.conditional_headers(url)
+    ) as resp:
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes(chunk_size=8192):
+            parser.feed(chunk)
+            fed = True
+        http_cache.store_validators(url, resp)
+    if not fed:
+        # Empty body; give the parser something so close() has a document.
+        parser.feed(b"<html></html>")
+    return parser.close()
+
+
+async def conditional_get_bytes(url: str) -> bytes | None:
+    """Like :func:`conditional_get` but returns the raw body bytes.
+
+    Skips httpx's charset decode entirely; lxml decodes the bytes itself
+    from the document's declared encoding, so parsers that never touch the
+    body as text avoid one full pass over every downloaded page.
+    """
+    client = get_shared_client()
+    resp = await client.get(url, headers=http_cache.conditional_headers(url))
+    if resp.status_code == 304:
+        return None
+    resp.raise_for_status()
+    http_cache.store_validators(url, resp)
+    return resp.content
+
+
+async def conditional_get(url: str) -> str | None:
+    """GET a page, returning None when the server says 304 Not Modified.
+
+    ETag / Last-Modified validators remembered from previous runs are sent
+    as If-None-Match / If-Modified-Since, so unchanged pages cost one
+    bodyless round-trip and the caller can skip parsing entirely.
+    """
+    client = get_shared_client()
+    resp = await client.get(url, headers=http_cache.conditional_headers(url))
+    if resp.status_code == 304:
+        return None
+    resp.raise_for_status()
+    http_cache.store_validators(url, resp)
+    return resp.text
 
 
 class BaseCollector(ABC):
-    """Abstract base for all OSINT source collectors."""
+    """Abstract base for all OSINT source collectors.
 
+    Subclasses that set the ``name`` class attribute are registered
+    automatically at class-creation time; no decorator needed.
+    """
+
+    name: str  # registry key, e.g. "hmrc"
     source_name: str
     source_url: str
     source_layer: SourceLayer
     primary_index: IndexType
     check_frequency: str  # "daily" or "weekly"
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Only classes declaring their own name register; intermediate
+        # abstract subclasses without one are skipped. Imported lazily to
+        # avoid a base ↔ registry import cycle.
+        name = cls.__dict__.get("name")
+        if name:
+            from src.collectors.registry import _COLLECTORS
+
+            _COLLECTORS[name] = cls
+
     @abstractmethod
     async def collect(self) -> list[RawEvent]:
         """Fetch raw content from the OSINT source.
@@ -77,17 +297,10 @@ class BaseCollector(ABC):
         ...
 
     @abstractmethod
-    async def parse(self, raw_html: str) -> list[RawEvent]:
+    async def parse(self, raw_html: str | bytes) -> list[RawEvent]:
         """Parse raw HTML/content into structured raw events."""
         ...
 
     def get_scrape_url(self) -> str:
         """Return the runtime URL used for HTTP/Playwright fetches."""
         return getattr(self, "scrape_url", self.source_url)
-
-    def get_source_origin(self) -> str:
-        """Return scheme + host from scrape URL for resolving relative links."""
-        parsed = urlsplit(self.get_scrape_url())
-        if parsed.scheme and parsed.netloc:
-            return f"{parsed.scheme}://{parsed.netloc}"
-        return ""
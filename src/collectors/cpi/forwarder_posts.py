@@ -12,12 +12,11 @@ Analysts paste forwarder observations they've seen on LinkedIn/RSS.
 from datetime import date
 
 from src.collectors.base import BaseCollector, RawEvent
-from src.collectors.registry import register
 from src.db.models import IndexType, SourceLayer
 
 
-@register("forwarder_posts")
 class ForwarderPostsCollector(BaseCollector):
+    name = "forwarder_posts"
     source_name = "Freight Forwarder Advisory (UK)"
     source_url = ""
     source_layer = SourceLayer.INDUSTRY
@@ -13,17 +13,20 @@ Delta triggers:
 from datetime import date
 
 import httpx
-from bs4 import BeautifulSoup
 
-from src.collectors.base import BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    extract_text,
+    fetch_text_capped,
+)
 from src.db.models import IndexType, SourceLayer
 
 FBX_URL = "https://fbx.freightos.com/"
 
 
-@register("freight_rates")
 class FreightRateCollector(BaseCollector):
+    name = "freight_rates"
     source_name = "Freightos Baltic Index (FBX)"
     source_url = FBX_URL
     source_layer = SourceLayer.MARKET
@@ -32,33 +35,26 @@ class FreightRateCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30,
-            follow_redirects=True,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+        try:
+            # Only a short excerpt is kept, so cap the download instead of
+            # pulling the whole page.
+            text = await fetch_text_capped(target_url)
+            if text is None:
+                # 304 — page unchanged since the last run, nothing to report.
+                return []
+            return await self.parse(text)
+        except httpx.HTTPError:
+            return [
+                RawEvent(
+                    title="FBX Freight Rate - Fetch Failed",
+                    content="Could not reach Freightos. Manual check required.",
+                    url=self.source_url,
+                    published_date=date.today(),
                 )
-            },
-        ) as client:
-            try:
-                resp = await client.get(target_url)
-                resp.raise_for_status()
-                return await self.parse(resp.text)
-            except httpx.HTTPError:
-                return [
-                    RawEvent(
-                        title="FBX Freight Rate - Fetch Failed",
-                        content="Could not reach Freightos. Manual check required.",
-                        url=self.source_url,
-                        published_date=date.today(),
-                    )
-                ]
+            ]
 
     async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
-        page_text = soup.get_text(separator=" ", strip=True)[:2000]
+        page_text = extract_text(raw_html, limit=2000)
 
         return [
             RawEvent(
@@ -12,18 +12,15 @@ Delta triggers:
 
 from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html
+from src.collectors.base import BaseCollector, RawEvent, conditional_get_bytes
 from src.db.models import IndexType, SourceLayer
 
 XE_URL = "https://www.xe.com/currencyconverter/convert/?Amount=1&From=INR&To=GBP"
 
 
-@register("fx_inr_gbp")
 class FXINRGBPCollector(BaseCollector):
+    name = "fx_inr_gbp"
     source_name = "INR/GBP Exchange Rate (XE.com)"
     source_url = "https://www.xe.com/currencycharts/?from=INR&to=GBP"
     scrape_url = XE_URL
@@ -33,39 +30,28 @@ class FXINRGBPCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30,
-            follow_redirects=True,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            },
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+        page = await conditional_get_bytes(target_url)
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return await self.parse(page)
 
-    async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+    async def parse(self, raw_html: str | bytes) -> list[RawEvent]:
+        tree = html.parse(raw_html)
 
         # XE embeds the conversion result in a <p> with class containing "result"
         rate_text = ""
-        rate_el = (
-            soup.find("p", class_=lambda c: c and "result" in c.lower())
-            if soup
-            else None
-        )
-        if rate_el:
-            rate_text = rate_el.get_text(strip=True)
+        for p in tree.iter("p"):
+            if "result" in (p.get("class") or "").lower():
+                rate_text = html.text(p)
+                break
 
         if not rate_text:
-            # Fallback: look for any element containing the rate pattern
-            for el in soup.find_all(string=lambda s: s and "GBP" in s and "INR" in s):
-                rate_text = el.strip()
-                break
+            # Fallback: look for any text containing the rate pattern
+            for s in tree.itertext():
+                if "GBP" in s and "INR" in s:
+                    rate_text = s.strip()
+                    break
 
         if not rate_text:
             rate_text = "Rate data unavailable — manual check required"
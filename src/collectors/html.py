@@ -0,0 +1,102 @@
+"""Precompiled CSS selectors over lxml trees.
+
+BeautifulSoup re-dispatches every ``.select()`` call through soupsieve;
+parsing straight into an lxml tree and matching with compiled XPath
+skips the wrapper object construction entirely. Only the small CSS
+subset the collectors actually use is supported — type and class
+selectors, compound steps (``li.item``), descendant combinators
+(``table tr``), attribute presence (``a[href]``) and suffix match
+(``a[href$='.pdf']``), and comma-separated groups — and each selector
+string compiles to an ``lxml.etree.XPath`` exactly once per process.
+"""
+
+import functools
+import re
+
+import lxml.etree
+import lxml.html
+
+_STEP_RE = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<classes>(?:\.[\w-]+)*)"
+    r"(?P<attr>\[[^\]]+\])?$"
+)
+_ATTR_RE = re.compile(r"^\[(?P<name>[\w-]+)(?:(?P<op>\$?=)'?(?P<value>[^'\]]*)'?)?\]$")
+
+
+def _class_predicate(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _step_to_xpath(step: str) -> str:
+    match = _STEP_RE.match(step)
+    if not match:
+        raise ValueError(f"Unsupported CSS step: {step!r}")
+
+    tag = match.group("tag") or "*"
+    predicates = [
+        _class_predicate(cls) for cls in match.group("classes").split(".") if cls
+    ]
+
+    attr = match.group("attr")
+    if attr:
+        attr_match = _ATTR_RE.match(attr)
+        if not attr_match:
+            raise ValueError(f"Unsupported attribute selector: {attr!r}")
+        name, op, value = attr_match.group("name", "op", "value")
+        if op is None:
+            predicates.append(f"@{name}")
+        elif op == "=":
+            predicates.append(f"@{name}='{value}'")
+        else:  # op == "$="
+            predicates.append(
+                f"substring(@{name}, string-length(@{name})"
+                f" - string-length('{value}') + 1) = '{value}'"
+            )
+
+    return tag + "".join(f"[{p}]" for p in predicates)
+
+
+def css_to_xpath(selector: str) -> str:
+    """Translate a CSS selector group to a relative XPath expression."""
+    paths = []
+    for alternative in selector.split(","):
+        steps = alternative.split()
+        if not steps:
+            raise ValueError(f"Empty alternative in selector: {selector!r}")
+        paths.append(".//" + "//".join(_step_to_xpath(step) for step in steps))
+    return " | ".join(paths)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_selector(selector: str) -> lxml.etree.XPath:
+    """Compile a CSS selector to a cached relative XPath matcher."""
+    return lxml.etree.XPath(css_to_xpath(selector))
+
+
+def select(node, selector: str) -> list:
+    """Match a CSS selector against a tree or element, in document order."""
+    return compile_selector(selector)(node)
+
+
+def select_one(node, selector: str):
+    """Return the first match for a CSS selector, or None."""
+    matches = compile_selector(selector)(node)
+    return matches[0] if matches else None
+
+
+def text(el) -> str:
+    """Concatenated, stripped text content — mirrors get_text(strip=True)."""
+    return "".join(s.strip() for s in el.itertext())
+
+
+def parse(raw_html: str | bytes) -> lxml.html.HtmlElement:
+    """Parse HTML into an lxml tree; empty input yields an empty tree.
+
+    Accepts bytes as well as text: libxml2 decodes bytes itself using the
+    document's declared charset, so callers fetching raw response bodies
+    skip a full Python-level decode pass.
+    """
+    if not raw_html or not raw_html.strip():
+        return lxml.html.fromstring("<html></html>")
+    return lxml.html.fromstring(raw_html)
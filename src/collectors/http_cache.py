@@ -0,0 +1,61 @@
+"""On-disk cache of HTTP validators for conditional GETs.
+
+Weekly collectors re-fetch landing pages that rarely change mid-week.
+Remembering each URL's ETag / Last-Modified between runs lets the next
+fetch send If-None-Match / If-Modified-Since and come back as a bodyless
+304 when nothing changed. The cache is a small JSON sidecar file rather
+than a DB table so collectors stay decoupled from the database layer.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import httpx
+
+_CACHE_PATH = Path(os.environ.get("ADVUMAN_HTTP_CACHE", ".http_cache.json"))
+
+_cache: dict[str, dict[str, str]] | None = None
+
+
+def _load() -> dict[str, dict[str, str]]:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def conditional_headers(url: str) -> dict[str, str]:
+    """Return If-None-Match / If-Modified-Since headers for a cached URL."""
+    entry = _load().get(url)
+    if not entry:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def store_validators(url: str, response: httpx.Response) -> None:
+    """Record a response's cache validators; no-op if it carries none."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    entry = {}
+    if etag:
+        entry["etag"] = etag
+    if last_modified:
+        entry["last_modified"] = last_modified
+    cache = _load()
+    cache[url] = entry
+    try:
+        _CACHE_PATH.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        # A read-only working directory just means no caching this run.
+        pass
@@ -0,0 +1,24 @@
+"""Single-pass keyword pre-scan for raw HTML.
+
+Several parsers only emit events whose text contains one of a handful of
+literal keywords. Scanning the raw page once with a compiled alternation
+(one C-level pass) is far cheaper than building an lxml tree and walking
+it just to discover that nothing on the page can match.
+"""
+
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+def contains_any(text: str, keywords: tuple[str, ...]) -> bool:
+    """Return True if any of the literal keywords occurs in ``text``.
+
+    Case-insensitive. The compiled pattern is cached per keyword tuple, so
+    repeated calls from a collector's parse() pay only the scan itself.
+    """
+    return _compile(keywords).search(text) is not None
@@ -1,7 +1,7 @@
 """Carrier service advisory collector (Maersk/MSC).
 
 Source: https://www.maersk.com/news/advisories
-Method: HTTP + BeautifulSoup
+Method: HTTP + lxml
 Check: Daily (Morning, 3 min)
 Index: LSI
 Signals: Blank sailings on India-UK route, service disruptions
@@ -10,17 +10,25 @@ Signals: Blank sailings on India-UK route, service disruptions
 from datetime import date
 
 import httpx
-from bs4 import BeautifulSoup
 
-from src.collectors.base import BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html, keyword_scan
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get,
+)
 from src.db.models import IndexType, SourceLayer
 
 MAERSK_ADVISORIES_URL = "https://www.maersk.com/news/advisories"
 
+# Only advisories mentioning one of these are kept, so a page without any of
+# them cannot produce events and need not be parsed at all.
+RELEVANCE_KEYWORDS = ("india", "uk", "europe", "blank", "service change")
+
 
-@register("carriers")
 class CarrierCollector(BaseCollector):
+    name = "carriers"
     source_name = "Carrier Service Notice (Maersk/MSC)"
     source_url = MAERSK_ADVISORIES_URL
     source_layer = SourceLayer.LOGISTICS
@@ -34,61 +42,54 @@ class CarrierCollector(BaseCollector):
 
     async def _collect_maersk(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30,
-            follow_redirects=True,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
+        try:
+            html = await conditional_get(target_url)
+            if html is None:
+                # 304 — page unchanged since the last check, nothing new.
+                return []
+            return await self.parse(html)
+        except httpx.HTTPError:
+            return [
+                RawEvent(
+                    title="Maersk Advisories - Fetch Failed",
+                    content="Could not reach Maersk advisory page. Manual check required.",
+                    url=self.source_url,
+                    published_date=date.today(),
                 )
-            },
-        ) as client:
-            try:
-                resp = await client.get(target_url)
-                resp.raise_for_status()
-                return await self.parse(resp.text)
-            except httpx.HTTPError:
-                return [
-                    RawEvent(
-                        title="Maersk Advisories - Fetch Failed",
-                        content="Could not reach Maersk advisory page. Manual check required.",
-                        url=self.source_url,
-                        published_date=date.today(),
-                    )
-                ]
+            ]
 
     async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+        # Cheap pre-scan: skip tree building when no keyword appears anywhere.
+        if not keyword_scan.contains_any(raw_html, RELEVANCE_KEYWORDS):
+            return []
+
+        tree = html.parse(raw_html)
         events = []
 
-        for article in soup.select("article, .advisory-item, .news-card, .list-item"):
-            title_el = article.select_one("h2, h3, a, .title")
-            if not title_el:
+        for article in html.select(
+            tree, "article, .advisory-item, .news-card, .list-item"
+        ):
+            title_el = html.select_one(article, "h2, h3, a, .title")
+            if title_el is None:
                 continue
 
-            title = title_el.get_text(strip=True)
+            title = html.text(title_el)
             href = ""
-            if title_el.name == "a":
+            if title_el.tag == "a":
                 href = title_el.get("href", "")
             else:
-                link_el = article.select_one("a[href]")
-                if link_el:
+                link_el = html.select_one(article, "a[href]")
+                if link_el is not None:
                     href = link_el.get("href", "")
 
-            if href and not href.startswith("http"):
-                origin = self.get_source_origin() or "https://www.maersk.com"
-                href = f"{origin}{href}"
+            href = absolutize(self.get_scrape_url(), href)
 
-            content_el = article.select_one("p, .description, .excerpt")
-            content = content_el.get_text(strip=True) if content_el else title
+            content_el = html.select_one(article, "p, .description, .excerpt")
+            content = html.text(content_el) if content_el is not None else title
 
             # Filter for India/UK relevance
-            combined = f"{title} {content}".lower()
-            if any(
-                kw in combined
-                for kw in ["india", "uk", "europe", "blank", "service change"]
-            ):
+            combined = f"{title} {content}"
+            if keyword_scan.contains_any(combined, RELEVANCE_KEYWORDS):
                 events.append(
                     RawEvent(
                         title=title,
@@ -1,7 +1,7 @@
 """Port of Felixstowe operations news collector.
 
 Source: https://www.portoffelixstowe.co.uk/operations/news/
-Method: HTTP + BeautifulSoup (simple HTML)
+Method: HTTP + lxml (simple HTML)
 Check: Daily (Morning, 3 min)
 Index: LSI
 
@@ -9,20 +9,23 @@ Signals: Port congestion advisory, operational disruption
 Baseline: "Normal operations" logged as delta=0 (used in "What Did Not Change")
 """
 
-from datetime import date, datetime
+from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get_bytes,
+    parse_iso_date,
+)
 from src.db.models import IndexType, SourceLayer
 
 FELIXSTOWE_URL = "https://www.portoffelixstowe.co.uk/operations/news/"
 
 
-@register("felixstowe")
 class FelixstoweCollector(BaseCollector):
+    name = "felixstowe"
     source_name = "Port of Felixstowe"
     source_url = FELIXSTOWE_URL
     source_layer = SourceLayer.LOGISTICS
@@ -31,46 +34,39 @@ class FelixstoweCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True, headers=DEFAULT_HEADERS
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
-
-    async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+        page = await conditional_get_bytes(target_url)
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return await self.parse(page)
+
+    async def parse(self, raw_html: str | bytes) -> list[RawEvent]:
+        tree = html.parse(raw_html)
         events = []
 
         # Look for news article links/items on the page
-        for article in soup.select("article, .news-item, .post-item, li.item"):
-            title_el = article.select_one("h2, h3, .title, a")
-            if not title_el:
+        for article in html.select(tree, "article, .news-item, .post-item, li.item"):
+            title_el = html.select_one(article, "h2, h3, .title, a")
+            if title_el is None:
                 continue
 
-            title = title_el.get_text(strip=True)
-            link = title_el.get("href", "") if title_el.name == "a" else ""
+            title = html.text(title_el)
+            link = title_el.get("href", "") if title_el.tag == "a" else ""
             if not link:
-                link_el = article.select_one("a")
-                link = link_el.get("href", "") if link_el else ""
+                link_el = html.select_one(article, "a")
+                link = link_el.get("href", "") if link_el is not None else ""
 
-            if link and not link.startswith("http"):
-                origin = (
-                    self.get_source_origin() or "https://www.portoffelixstowe.co.uk"
-                )
-                link = f"{origin}{link}"
+            link = absolutize(self.get_scrape_url(), link)
 
-            content_el = article.select_one("p, .excerpt, .summary")
-            content = content_el.get_text(strip=True) if content_el else title
+            content_el = html.select_one(article, "p, .excerpt, .summary")
+            content = html.text(content_el) if content_el is not None else title
 
-            date_el = article.select_one("time, .date, .meta")
+            date_el = html.select_one(article, "time, .date, .meta")
             pub_date = None
-            if date_el:
-                dt_str = date_el.get("datetime", "") or date_el.get_text(strip=True)
+            if date_el is not None:
+                dt_str = date_el.get("datetime", "") or html.text(date_el)
                 try:
-                    pub_date = datetime.fromisoformat(
-                        dt_str.replace("Z", "+00:00")
-                    ).date()
+                    pub_date = parse_iso_date(dt_str)
                 except (ValueError, AttributeError):
                     pub_date = date.today()
 
@@ -10,17 +10,34 @@ Note: Homepage banner only — don't deep-dive PDFs (per OSINT guide)
 from datetime import date
 
 import httpx
-from bs4 import BeautifulSoup
 
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html, keyword_scan
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get,
+)
 from src.db.models import IndexType, SourceLayer
 
 JNPT_URL = "https://www.jnport.gov.in/"
 
+PDF_KEYWORDS = ("advisory", "congestion", "notice", "operation")
+
+# Explicit signs that the plain-HTTP response is a JavaScript shell rather
+# than the rendered homepage.
+JS_MARKERS = ("enable javascript", "javascript is required", "javascript to run")
+
+# Banner notices, alerts, marquee text and news tickers, compiled once into a
+# single union XPath so each parse is one tree walk, not eight.
+BANNER_XPATH = html.compile_selector(
+    ".banner, .notice, .alert, marquee, .news-ticker, "
+    ".announcement, .highlight, .scroll-text"
+)
+
 
-@register("jnpt")
 class JNPTCollector(BaseCollector):
+    name = "jnpt"
     source_name = "JNPT (Nhava Sheva) Port Advisory"
     source_url = JNPT_URL
     source_layer = SourceLayer.LOGISTICS
@@ -28,34 +45,43 @@ class JNPTCollector(BaseCollector):
     check_frequency = "daily"
 
     async def collect(self) -> list[RawEvent]:
-        # Try basic HTTP first; fall back to Playwright if JS-rendered
+        # Try basic HTTP first. Launching Chromium costs seconds, so the
+        # Playwright fallback fires only on a failed fetch or when the
+        # response is plainly a JS shell — not on any exception.
         try:
-            return await self._collect_http()
-        except Exception:
+            page = await conditional_get(self.get_scrape_url())
+        except httpx.HTTPError:
+            return await self._collect_playwright()
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        if self._needs_js(page):
             return await self._collect_playwright()
+        return await self.parse(page)
 
-    async def _collect_http(self) -> list[RawEvent]:
-        target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True, headers=DEFAULT_HEADERS
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+    @staticmethod
+    def _needs_js(raw_html: str) -> bool:
+        """Heuristic: near-empty document or an 'enable JavaScript' marker."""
+        if len(raw_html) < 2048:
+            return True
+        lowered = raw_html.lower()
+        return any(marker in lowered for marker in JS_MARKERS)
 
     async def _collect_playwright(self) -> list[RawEvent]:
         try:
-            from playwright.async_api import async_playwright
+            from src.collectors.playwright_pool import get_browser
 
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            # The browser is shared process-wide; only the page is per-call.
+            browser = await get_browser()
+            page = await browser.new_page()
+            try:
                 await page.goto(
                     self.get_scrape_url(), wait_until="domcontentloaded", timeout=30000
                 )
-                html = await page.content()
-                await browser.close()
-                return await self.parse(html)
+                content = await page.content()
+            finally:
+                await page.close()
+            return await self.parse(content)
         except ImportError:
             return [
                 RawEvent(
@@ -67,15 +93,12 @@ class JNPTCollector(BaseCollector):
             ]
 
     async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+        tree = html.parse(raw_html)
         events = []
 
         # Look for banner notices, alerts, marquee text, or news tickers
-        for el in soup.select(
-            ".banner, .notice, .alert, marquee, .news-ticker, "
-            ".announcement, .highlight, .scroll-text"
-        ):
-            text = el.get_text(strip=True)
+        for el in BANNER_XPATH(tree):
+            text = html.text(el)
             if text and len(text) > 10:
                 events.append(
                     RawEvent(
@@ -86,24 +109,21 @@ class JNPTCollector(BaseCollector):
                     )
                 )
 
-        # Also check for any linked PDFs about operations
-        for link in soup.select("a[href$='.pdf']"):
-            text = link.get_text(strip=True)
-            if any(
-                kw in text.lower()
-                for kw in ["advisory", "congestion", "notice", "operation"]
-            ):
-                href = link.get("href", "")
-                origin = self.get_source_origin() or "https://www.jnport.gov.in"
-                full_url = href if href.startswith("http") else f"{origin}{href}"
-                events.append(
-                    RawEvent(
-                        title=text,
-                        content=f"PDF advisory: {text}",
-                        url=full_url,
-                        published_date=date.today(),
+        # Also check for any linked PDFs about operations; pre-scan the raw
+        # page so the link walk is skipped when no keyword appears at all.
+        if keyword_scan.contains_any(raw_html, PDF_KEYWORDS):
+            for link in html.select(tree, "a[href$='.pdf']"):
+                text = html.text(link)
+                if keyword_scan.contains_any(text, PDF_KEYWORDS):
+                    full_url = absolutize(self.get_scrape_url(), link.get("href", ""))
+                    events.append(
+                        RawEvent(
+                            title=text,
+                            content=f"PDF advisory: {text}",
+                            url=full_url,
+                            published_date=date.today(),
+                        )
                     )
-                )
 
         if not events:
             events.append(
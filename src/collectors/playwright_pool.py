@@ -0,0 +1,41 @@
+"""Shared Playwright browser for JS-heavy collectors.
+
+Chromium startup dominates any Playwright-based collection (seconds per
+launch), while pages and contexts are cheap. The browser is therefore
+launched lazily once per process and reused; drivers close it on shutdown
+alongside the shared HTTP client.
+
+Imports of playwright are deferred so the module stays importable when the
+optional dependency is missing — callers see the ImportError only when they
+actually need a browser.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
+
+_playwright = None
+_browser: "Browser | None" = None
+
+
+async def get_browser() -> "Browser":
+    """Return the shared headless Chromium, launching it on first use."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        from playwright.async_api import async_playwright
+
+        _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+
+async def close_browser() -> None:
+    """Shut down the shared browser (called by drivers on shutdown)."""
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        await _browser.close()
+    if _playwright is not None:
+        await _playwright.stop()
+    _browser = None
+    _playwright = None
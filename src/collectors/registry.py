@@ -1,19 +1,46 @@
-"""Collector registry — discover, register, and run collectors."""
+"""Collector registry — discover, register, and run collectors.
+
+Registration happens automatically: BaseCollector.__init_subclass__ adds
+any subclass that declares a ``name`` class attribute to _COLLECTORS when
+its module is imported.
+"""
+
+import asyncio
+import importlib
 
 from src.collectors.base import BaseCollector, ClassifiedEvent
 
 # Registry of all available collectors
 _COLLECTORS: dict[str, type[BaseCollector]] = {}
 
+# Static name → module map so callers can list or lazily import collectors
+# without paying the import cost of all 12 modules up front.
+COLLECTOR_MODULES: dict[str, str] = {
+    "dgft": "src.collectors.rpi.dgft",
+    "hmrc": "src.collectors.rpi.hmrc",
+    "ukft": "src.collectors.rpi.ukft",
+    "uk_tra": "src.collectors.rpi.uk_tra",
+    "jnpt": "src.collectors.lsi.jnpt",
+    "felixstowe": "src.collectors.lsi.felixstowe",
+    "carriers": "src.collectors.lsi.carriers",
+    "loadstar": "src.collectors.lsi.loadstar",
+    "fx_inr_gbp": "src.collectors.cpi.fx_inr_gbp",
+    "cotton": "src.collectors.cpi.cotton",
+    "freight_rates": "src.collectors.cpi.freight_rates",
+    "forwarder_posts": "src.collectors.cpi.forwarder_posts",
+}
 
-def register(name: str):
-    """Decorator to register a collector class by name."""
 
-    def wrapper(cls: type[BaseCollector]):
-        _COLLECTORS[name] = cls
-        return cls
+def import_collectors(names: list[str] | None = None) -> None:
+    """Import (and thereby register) the named collector modules.
 
-    return wrapper
+    With no argument, imports every known collector. Unknown names are left
+    for `get_collector` to report with its usual error.
+    """
+    for name in names if names is not None else COLLECTOR_MODULES:
+        module = COLLECTOR_MODULES.get(name)
+        if module is not None:
+            importlib.import_module(module)
 
 
 def get_collector(name: str) -> type[BaseCollector]:
@@ -36,3 +63,29 @@ async def run_collector(name: str) -> list[ClassifiedEvent]:
     raw_events = await collector.collect()
     # Classification happens in a separate step (LLM layer)
     return raw_events
+
+
+async def run_all(
+    names: list[str] | None = None, concurrency: int = 16
+) -> dict[str, list[ClassifiedEvent] | BaseException]:
+    """Run collectors concurrently and map each name to its result.
+
+    Collectors are pure network I/O with no mutual dependencies, so they
+    overlap under a bounded semaphore instead of summing their timeouts.
+    A failing collector contributes its exception rather than cancelling
+    the rest.
+    """
+    if names is None:
+        import_collectors()
+        names = list_collectors()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(name: str) -> list[ClassifiedEvent]:
+        async with semaphore:
+            return await run_collector(name)
+
+    results = await asyncio.gather(
+        *(_bounded(name) for name in names), return_exceptions=True
+    )
+    return dict(zip(names, results))
@@ -1,7 +1,7 @@
 """DGFT (Directorate General of Foreign Trade, India) collector.
 
 Source: https://dgft.gov.in/
-Method: HTTP + BeautifulSoup
+Method: HTTP + lxml
 Check: Daily (Morning, 5 min)
 Index: RPI
 Keywords: 'Export', 'Textiles', 'HS 50-63', 'Documentation', 'Certificate', 'Amendment'
@@ -9,18 +9,22 @@ Keywords: 'Export', 'Textiles', 'HS 50-63', 'Documentation', 'Certificate', 'Ame
 
 from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html, keyword_scan
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get,
+)
 from src.db.models import IndexType, SourceLayer
 
 DGFT_NOTIFICATIONS_URL = "https://dgft.gov.in/CP/?opt=notification"
 
+FALLBACK_KEYWORDS = ("notification", "circular", "public notice")
+
 
-@register("dgft")
 class DGFTCollector(BaseCollector):
+    name = "dgft"
     source_name = "DGFT (India) Notifications"
     source_url = "https://dgft.gov.in/"
     scrape_url = DGFT_NOTIFICATIONS_URL
@@ -30,32 +34,27 @@ class DGFTCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30,
-            follow_redirects=True,
-            headers=DEFAULT_HEADERS,
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+        page = await conditional_get(target_url)
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return await self.parse(page)
 
     async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+        tree = html.parse(raw_html)
         events = []
 
         # DGFT typically lists notifications in a table or list
-        for row in soup.select("table tr, .notification-item, .views-row"):
-            cells = row.select("td")
+        for row in html.select(tree, "table tr, .notification-item, .views-row"):
+            cells = html.select(row, "td")
             if len(cells) >= 2:
-                title = cells[0].get_text(strip=True)
-                link_el = row.select_one("a[href]")
+                title = html.text(cells[0])
+                link_el = html.select_one(row, "a[href]")
                 url = ""
-                if link_el:
-                    href = link_el.get("href", "")
-                    origin = self.get_source_origin() or "https://dgft.gov.in"
-                    url = href if href.startswith("http") else f"{origin}{href}"
+                if link_el is not None:
+                    url = absolutize(self.get_scrape_url(), link_el.get("href", ""))
 
-                content = " | ".join(c.get_text(strip=True) for c in cells)
+                content = " | ".join(html.text(c) for c in cells)
                 events.append(
                     RawEvent(
                         title=title or "DGFT Notification",
@@ -65,20 +64,18 @@ class DGFTCollector(BaseCollector):
                     )
                 )
 
-        # Fallback: check for any links with notification-like text
-        if not events:
-            for link in soup.select("a[href]"):
-                text = link.get_text(strip=True).lower()
-                if any(
-                    kw in text for kw in ["notification", "circular", "public notice"]
-                ):
-                    href = link.get("href", "")
-                    origin = self.get_source_origin() or "https://dgft.gov.in"
-                    full_url = href if href.startswith("http") else f"{origin}{href}"
+        # Fallback: check for any links with notification-like text. The raw
+        # page is pre-scanned first — no keyword anywhere means no link can
+        # match, so the full link walk is skipped.
+        if not events and keyword_scan.contains_any(raw_html, FALLBACK_KEYWORDS):
+            for link in html.select(tree, "a[href]"):
+                link_text = html.text(link)
+                if keyword_scan.contains_any(link_text, FALLBACK_KEYWORDS):
+                    full_url = absolutize(self.get_scrape_url(), link.get("href", ""))
                     events.append(
                         RawEvent(
-                            title=link.get_text(strip=True),
-                            content=link.get_text(strip=True),
+                            title=link_text,
+                            content=link_text,
                             url=full_url,
                             published_date=date.today(),
                         )
@@ -1,19 +1,22 @@
 """HMRC / UK Customs collector.
 
 Source: https://www.gov.uk/government/organisations/hm-revenue-customs
-Method: HTTP + BeautifulSoup (GOV.UK has clean, well-structured HTML)
+Method: HTTP + lxml (GOV.UK has clean, well-structured HTML)
 Check: Daily (Morning, 5 min)
 Index: RPI
 Keywords: 'India', 'textiles', 'HS 50-63', 'commodity codes', 'customs'
 """
 
-from datetime import date, datetime
+from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get_tree,
+    parse_iso_date,
+)
 from src.db.models import IndexType, SourceLayer
 
 HMRC_SEARCH_URL = (
@@ -24,8 +27,8 @@ HMRC_SEARCH_URL = (
 )
 
 
-@register("hmrc")
 class HMRCCollector(BaseCollector):
+    name = "hmrc"
     source_name = "HMRC / UK Customs Update"
     source_url = "https://www.gov.uk/government/organisations/hm-revenue-customs"
     scrape_url = HMRC_SEARCH_URL
@@ -35,37 +38,36 @@ class HMRCCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True, headers=DEFAULT_HEADERS
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+        # Stream response bytes straight into the parser; no intermediate
+        # full-body string is built.
+        tree = await conditional_get_tree(target_url)
+        if tree is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return self._extract(tree)
 
     async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+        return self._extract(html.parse(raw_html))
+
+    def _extract(self, tree) -> list[RawEvent]:
         events = []
 
-        for result in soup.select("li.gem-c-document-list__item"):
-            link_el = result.select_one("a.gem-c-document-list__item-title")
-            if not link_el:
+        for result in html.select(tree, "li.gem-c-document-list__item"):
+            link_el = html.select_one(result, "a.gem-c-document-list__item-title")
+            if link_el is None:
                 continue
 
-            title = link_el.get_text(strip=True)
-            href = link_el.get("href", "")
-            origin = self.get_source_origin() or "https://www.gov.uk"
-            url = f"{origin}{href}" if href.startswith("/") else href
+            title = html.text(link_el)
+            url = absolutize(self.get_scrape_url(), link_el.get("href", ""))
 
-            desc_el = result.select_one(".gem-c-document-list__item-description")
-            description = desc_el.get_text(strip=True) if desc_el else ""
+            desc_el = html.select_one(result, ".gem-c-document-list__item-description")
+            description = html.text(desc_el) if desc_el is not None else ""
 
-            meta_el = result.select_one(".gem-c-document-list__attribute time")
+            meta_el = html.select_one(result, ".gem-c-document-list__attribute time")
             pub_date = None
-            if meta_el and meta_el.get("datetime"):
+            if meta_el is not None and meta_el.get("datetime"):
                 try:
-                    pub_date = datetime.fromisoformat(
-                        meta_el["datetime"].replace("Z", "+00:00")
-                    ).date()
+                    pub_date = parse_iso_date(meta_el.get("datetime"))
                 except ValueError:
                     pub_date = date.today()
 
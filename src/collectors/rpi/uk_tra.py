@@ -1,7 +1,7 @@
 """UK Trade Remedies Authority (TRA) collector.
 
 Source: https://www.trade-remedies.service.gov.uk/public/cases/
-Method: HTTP + BeautifulSoup
+Method: HTTP + lxml
 Check: Weekly (Friday, 5 min)
 Index: RPI (and CPI when duties imposed)
 Signals: Anti-dumping investigations, safeguard measures on textile HS groups
@@ -9,18 +9,20 @@ Signals: Anti-dumping investigations, safeguard measures on textile HS groups
 
 from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get_bytes,
+)
 from src.db.models import IndexType, SourceLayer
 
 TRA_URL = "https://www.trade-remedies.service.gov.uk/public/cases/"
 
 
-@register("uk_tra")
 class UKTRACollector(BaseCollector):
+    name = "uk_tra"
     source_name = "UK Trade Remedies Authority"
     source_url = TRA_URL
     source_layer = SourceLayer.PRIMARY
@@ -29,36 +31,29 @@ class UKTRACollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True, headers=DEFAULT_HEADERS
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+        page = await conditional_get_bytes(target_url)
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return await self.parse(page)
 
-    async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+    async def parse(self, raw_html: str | bytes) -> list[RawEvent]:
+        tree = html.parse(raw_html)
         events = []
 
         # TRA lists cases in a table or list format
-        for row in soup.select("tr, .case-item, .govuk-table__row"):
-            cells = row.select("td, .govuk-table__cell")
+        for row in html.select(tree, "tr, .case-item, .govuk-table__row"):
+            cells = html.select(row, "td, .govuk-table__cell")
             if not cells:
                 continue
 
-            text = " | ".join(c.get_text(strip=True) for c in cells)
-            link_el = row.select_one("a[href]")
+            text = " | ".join(html.text(c) for c in cells)
+            link_el = html.select_one(row, "a[href]")
             href = ""
             title = text[:100]
-            if link_el:
-                title = link_el.get_text(strip=True)
-                href = link_el.get("href", "")
-                if href and not href.startswith("http"):
-                    origin = (
-                        self.get_source_origin()
-                        or "https://www.trade-remedies.service.gov.uk"
-                    )
-                    href = f"{origin}{href}"
+            if link_el is not None:
+                title = html.text(link_el)
+                href = absolutize(self.get_scrape_url(), link_el.get("href", ""))
 
             events.append(
                 RawEvent(
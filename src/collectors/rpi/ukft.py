@@ -1,26 +1,29 @@
 """UKFT (UK Fashion & Textile Association) news collector.
 
 Source: https://www.ukft.org/news/
-Method: HTTP + BeautifulSoup
+Method: HTTP + lxml
 Check: Daily (Afternoon, 3 min)
 Index: RPI
 Signals: Enforcement mentions, labelling compliance, import inspection changes
 """
 
-from datetime import date, datetime
+from datetime import date
 
-import httpx
-from bs4 import BeautifulSoup
-
-from src.collectors.base import DEFAULT_HEADERS, BaseCollector, RawEvent
-from src.collectors.registry import register
+from src.collectors import html
+from src.collectors.base import (
+    BaseCollector,
+    RawEvent,
+    absolutize,
+    conditional_get_bytes,
+    parse_iso_date,
+)
 from src.db.models import IndexType, SourceLayer
 
 UKFT_URL = "https://www.ukft.org/news/"
 
 
-@register("ukft")
 class UKFTCollector(BaseCollector):
+    name = "ukft"
     source_name = "UKFT (UK Fashion & Textile Association)"
     source_url = UKFT_URL
     source_layer = SourceLayer.INDUSTRY
@@ -29,38 +32,35 @@ class UKFTCollector(BaseCollector):
 
     async def collect(self) -> list[RawEvent]:
         target_url = self.get_scrape_url()
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True, headers=DEFAULT_HEADERS
-        ) as client:
-            resp = await client.get(target_url)
-            resp.raise_for_status()
-            return await self.parse(resp.text)
+        page = await conditional_get_bytes(target_url)
+        if page is None:
+            # 304 — page unchanged since the last check, nothing new.
+            return []
+        return await self.parse(page)
 
-    async def parse(self, raw_html: str) -> list[RawEvent]:
-        soup = BeautifulSoup(raw_html, "lxml")
+    async def parse(self, raw_html: str | bytes) -> list[RawEvent]:
+        tree = html.parse(raw_html)
         events = []
 
-        for article in soup.select("article, .post, .news-item, .entry"):
-            title_el = article.select_one("h2 a, h3 a, .entry-title a, a.title")
-            if not title_el:
-                title_el = article.select_one("h2, h3, .entry-title")
-            if not title_el:
+        for article in html.select(tree, "article, .post, .news-item, .entry"):
+            title_el = html.select_one(article, "h2 a, h3 a, .entry-title a, a.title")
+            if title_el is None:
+                title_el = html.select_one(article, "h2, h3, .entry-title")
+            if title_el is None:
                 continue
 
-            title = title_el.get_text(strip=True)
-            href = title_el.get("href", "") if title_el.name == "a" else ""
-            url = href if href.startswith("http") else self.source_url
+            title = html.text(title_el)
+            href = title_el.get("href", "") if title_el.tag == "a" else ""
+            url = absolutize(self.get_scrape_url(), href) or self.source_url
 
-            excerpt_el = article.select_one("p, .excerpt, .entry-summary")
-            content = excerpt_el.get_text(strip=True) if excerpt_el else title
+            excerpt_el = html.select_one(article, "p, .excerpt, .entry-summary")
+            content = html.text(excerpt_el) if excerpt_el is not None else title
 
-            date_el = article.select_one("time, .date, .published")
+            date_el = html.select_one(article, "time, .date, .published")
             pub_date = date.today()
-            if date_el and date_el.get("datetime"):
+            if date_el is not None and date_el.get("datetime"):
                 try:
-                    pub_date = datetime.fromisoformat(
-                        date_el["datetime"].replace("Z", "+00:00")
-                    ).date()
+                    pub_date = parse_iso_date(date_el.get("datetime"))
                 except ValueError:
                     pass
 
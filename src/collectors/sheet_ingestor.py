@@ -33,6 +33,7 @@ from src.db.models import (
     WeightedScore,
 )
 from src.db.seed import SOURCE_WEIGHTS
+from src.pipeline.attribution import pathway_mask
 from src.pipeline.scoring import compute_weighted_score
 
 logger = logging.getLogger(__name__)
@@ -459,6 +460,7 @@ class SheetIngestor:
                     confidence_level=row.confidence_level,
                     historical_precedent=row.historical_precedent,
                     impact_pathway=row.impact_pathway,
+                    pathway_mask=pathway_mask(row.impact_pathway),
                     quant_metric_triggered=row.quant_metric_triggered,
                     index_impact=row.index_impact,
                     index_delta=row.index_delta,
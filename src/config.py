@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
@@ -58,4 +60,12 @@ class Settings(BaseSettings):
     }
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings singleton on first use.
+
+    Lazy so that importing src.config (which every collector does) costs
+    nothing, and so scripts that set DATABASE_URL before their first real
+    settings access pick up the override.
+    """
+    return Settings()
@@ -28,33 +28,33 @@ if not os.getenv("DATABASE_URL"):
     st.stop()
 
 
+@st.cache_resource(show_spinner=False)
+def _pages() -> list[st.Page]:
+    """Page objects built once per process; each st.Page() resolves and
+    stats its script path, which there's no need to repeat per rerun."""
+    pages_dir = Path(__file__).resolve().parent / "pages"
+    return [
+        st.Page(
+            str(pages_dir / "lane_overview.py"),
+            title="Lane Overview",
+            icon="📊",
+            default=True,
+        ),
+        st.Page(str(pages_dir / "signal_log.py"), title="Signal Log", icon="📋"),
+        st.Page(str(pages_dir / "index_charts.py"), title="Index Charts", icon="📈"),
+        st.Page(str(pages_dir / "source_admin.py"), title="Source Admin", icon="🧭"),
+    ]
+
+
 def build_navigation():
+    # set_page_config is a per-run command and stays outside the cache.
     st.set_page_config(
         page_title="Advuman — Trade Lane Intelligence",
         page_icon="🔍",
         layout="wide",
         initial_sidebar_state="expanded",
     )
-
-    pages_dir = Path(__file__).resolve().parent / "pages"
-
-    return st.navigation(
-        [
-            st.Page(
-                str(pages_dir / "lane_overview.py"),
-                title="Lane Overview",
-                icon="📊",
-                default=True,
-            ),
-            st.Page(str(pages_dir / "signal_log.py"), title="Signal Log", icon="📋"),
-            st.Page(
-                str(pages_dir / "index_charts.py"), title="Index Charts", icon="📈"
-            ),
-            st.Page(
-                str(pages_dir / "source_admin.py"), title="Source Admin", icon="🧭"
-            ),
-        ]
-    )
+    return st.navigation(_pages())
 
 
 def main() -> None:
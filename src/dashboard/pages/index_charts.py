@@ -11,8 +11,10 @@ Shows:
 import asyncio
 from datetime import date, timedelta
 
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
+from plotly.subplots import make_subplots
 from sqlalchemy import select
 
 from src.db.models import IndexSnapshot, IndexType, LaneHealth, TradeLane
@@ -20,38 +22,87 @@ from src.db.session import async_session
 
 st.title("Index Charts — UK-India Textiles")
 
-days_range = st.slider("Days to show", 7, 180, 60)
+# Inside a form the slider doesn't rerun the script per drag tick; the
+# queries below only fire once, on Apply, instead of 10-50 times per
+# drag gesture.
+with st.form("range_form", border=False):
+    days_range = st.slider("Days to show", 7, 180, 60)
+    st.form_submit_button("Apply")
 
 
-async def get_snapshots():
-    start = date.today() - timedelta(days=days_range)
+async def get_snapshots(days: int):
+    start = date.today() - timedelta(days=days)
     async with async_session() as session:
+        # Plain column rows, not ORM objects: cheaper to hydrate and safe to
+        # pickle into the Streamlit cache.
         result = await session.execute(
-            select(IndexSnapshot)
+            select(
+                IndexSnapshot.date,
+                IndexSnapshot.index_type,
+                IndexSnapshot.weighted_total,
+                IndexSnapshot.z_score,
+            )
+            .join(TradeLane)
+            .where(TradeLane.name == "UK-India")
+            .where(IndexSnapshot.date >= start)
+            .order_by(IndexSnapshot.date)
+        )
+        return result.all()
+
+
+async def get_rpi_cusum(days: int):
+    """CUSUM trace data only: the RPI / non-null filter runs in SQL, so
+    other indexes' rows and null CUSUM columns never cross the wire."""
+    start = date.today() - timedelta(days=days)
+    async with async_session() as session:
+        result = await session.execute(
+            select(
+                IndexSnapshot.date,
+                IndexSnapshot.cusum_upper,
+                IndexSnapshot.cusum_lower,
+            )
             .join(TradeLane)
             .where(TradeLane.name == "UK-India")
+            .where(IndexSnapshot.index_type == IndexType.RPI)
+            .where(IndexSnapshot.cusum_upper.isnot(None))
             .where(IndexSnapshot.date >= start)
             .order_by(IndexSnapshot.date)
         )
-        return result.scalars().all()
+        return result.all()
 
 
-async def get_health_history():
-    start = date.today() - timedelta(days=days_range)
+async def get_health_history(days: int):
+    start = date.today() - timedelta(days=days)
     async with async_session() as session:
         result = await session.execute(
-            select(LaneHealth)
+            select(
+                LaneHealth.week_start,
+                LaneHealth.combined_total,
+                LaneHealth.health_status,
+            )
             .join(TradeLane)
             .where(TradeLane.name == "UK-India")
             .where(LaneHealth.week_start >= start)
             .order_by(LaneHealth.week_start)
         )
-        return result.scalars().all()
+        return result.all()
+
+
+async def load_all(days: int):
+    # Independent queries; run them concurrently on separate sessions.
+    return await asyncio.gather(
+        get_snapshots(days), get_rpi_cusum(days), get_health_history(days)
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_chart_data(days: int):
+    """Cached per slider value; reruns within the TTL skip the DB."""
+    return asyncio.run(load_all(days))
 
 
 try:
-    snapshots = asyncio.run(get_snapshots())
-    health_history = asyncio.run(get_health_history())
+    snapshots, cusum_rows, health_history = load_chart_data(days_range)
 except Exception as e:
     st.error(f"Database error: {e}")
     st.stop()
@@ -60,109 +111,186 @@ if not snapshots:
     st.info("No index data available. Run the pipeline to generate index snapshots.")
     st.stop()
 
-# ── Raw Index Totals ──
-st.subheader("Index Totals Over Time")
+# Bucket into per-field columns in one pass; the chart sections below would
+# otherwise each re-scan the full snapshot list and rebuild x/y lists per
+# index with repeated attribute lookups.
+buckets = {idx: {"date": [], "wt": [], "z": []} for idx in IndexType}
+for row in snapshots:
+    b = buckets[row.index_type]
+    b["date"].append(row.date)
+    b["wt"].append(row.weighted_total)
+    b["z"].append(row.z_score)
+
+# Hand Plotly typed arrays instead of Python lists: its encoder ships
+# ndarrays to the browser as base64 typed arrays, shrinking the JSON
+# payload, and NaN doubles for the nullable fields let the builders mask
+# missing values vectorised instead of filtering per element.
+for b in buckets.values():
+    b["date"] = np.asarray(b["date"], dtype="datetime64[D]")
+    b["wt"] = np.asarray(b["wt"], dtype="float64")
+    b["z"] = np.asarray(
+        [np.nan if v is None else v for v in b["z"]], dtype="float64"
+    )
+
+cusum = {
+    "date": np.asarray([r.date for r in cusum_rows], dtype="datetime64[D]"),
+    "cu": np.asarray([r.cusum_upper for r in cusum_rows], dtype="float64"),
+    "cl": np.asarray([r.cusum_lower for r in cusum_rows], dtype="float64"),
+}
+
+# Line traces use Scattergl (WebGL) below: SVG rendering puts a DOM node
+# per point and stutters past ~1k points when dragging the range slider.
+#
+# All four charts are emitted as one subplot figure through a single
+# st.plotly_chart call: one JSON payload to the frontend, one Plotly init,
+# and shared x-axis pan/zoom across the stacked panels. The builder is
+# cached and returns fig.to_dict(), which st.plotly_chart accepts directly,
+# so reruns within the TTL also skip Figure assembly and trace validation.
 
 colors = {"RPI": "#e74c3c", "LSI": "#3498db", "CPI": "#2ecc71"}
-fig = go.Figure()
 
-for idx_type in [IndexType.RPI, IndexType.LSI, IndexType.CPI]:
-    filtered = [s for s in snapshots if s.index_type == idx_type]
-    if filtered:
-        fig.add_trace(
-            go.Scatter(
-                x=[s.date for s in filtered],
-                y=[s.weighted_total for s in filtered],
-                name=idx_type.value,
-                line=dict(color=colors[idx_type.value]),
+
+@st.cache_data(ttl=60, show_spinner=False)
+def build_dashboard_fig(buckets: dict, cusum: dict, history: tuple) -> dict:
+    """Stacked totals / z-score / CUSUM / lane-health figure.
+
+    ``history`` is a tuple of (week_start, combined_total, status-value)
+    triples — plain hashable values, since SQLAlchemy Rows can't key the
+    cache.
+    """
+    fig = make_subplots(
+        rows=4,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.06,
+        subplot_titles=(
+            "Index Totals Over Time",
+            "Z-Score Deviation from Baseline",
+            "CUSUM — Persistent Shift Detection (RPI)",
+            "Lane Health History",
+        ),
+    )
+
+    # Row 1: raw index totals
+    for idx_type in [IndexType.RPI, IndexType.LSI, IndexType.CPI]:
+        b = buckets[idx_type]
+        if b["date"].size:
+            fig.add_trace(
+                go.Scattergl(
+                    x=b["date"],
+                    y=b["wt"],
+                    name=idx_type.value,
+                    legendgroup=idx_type.value,
+                    line=dict(color=colors[idx_type.value]),
+                ),
+                row=1,
+                col=1,
             )
-        )
 
-fig.update_layout(height=400, yaxis_title="Weighted Total")
-st.plotly_chart(fig, use_container_width=True)
-
-# ── Z-Score Deviation ──
-st.subheader("Z-Score Deviation from Baseline")
-
-fig_z = go.Figure()
-for idx_type in [IndexType.RPI, IndexType.LSI, IndexType.CPI]:
-    filtered = [
-        s for s in snapshots if s.index_type == idx_type and s.z_score is not None
-    ]
-    if filtered:
-        fig_z.add_trace(
-            go.Scatter(
-                x=[s.date for s in filtered],
-                y=[s.z_score for s in filtered],
-                name=idx_type.value,
-                line=dict(color=colors[idx_type.value]),
+    # Row 2: z-score deviation with threshold lines
+    for idx_type in [IndexType.RPI, IndexType.LSI, IndexType.CPI]:
+        b = buckets[idx_type]
+        mask = ~np.isnan(b["z"])
+        if mask.any():
+            fig.add_trace(
+                go.Scattergl(
+                    x=b["date"][mask],
+                    y=b["z"][mask],
+                    name=idx_type.value,
+                    legendgroup=idx_type.value,
+                    showlegend=False,
+                    line=dict(color=colors[idx_type.value]),
+                ),
+                row=2,
+                col=1,
             )
+    fig.add_hline(
+        y=2.0, line_dash="dash", line_color="red", annotation_text="+2σ", row=2, col=1
+    )
+    fig.add_hline(
+        y=-2.0, line_dash="dash", line_color="red", annotation_text="-2σ", row=2, col=1
+    )
+    fig.add_hline(y=0, line_dash="dot", line_color="gray", row=2, col=1)
+
+    # Row 3: CUSUM (RPI) — rows arrive pre-filtered from SQL.
+    if cusum["date"].size:
+        fig.add_trace(
+            go.Scattergl(
+                x=cusum["date"],
+                y=cusum["cu"],
+                name="C⁺ (Upper)",
+                line=dict(color="#e74c3c"),
+            ),
+            row=3,
+            col=1,
+        )
+        fig.add_trace(
+            go.Scattergl(
+                x=cusum["date"],
+                y=cusum["cl"],
+                name="C⁻ (Lower)",
+                line=dict(color="#3498db"),
+            ),
+            row=3,
+            col=1,
+        )
+        fig.add_hline(
+            y=4.5,
+            line_dash="dash",
+            line_color="red",
+            annotation_text="h=4.5 (alarm)",
+            row=3,
+            col=1,
         )
+        fig.add_hline(y=-4.5, line_dash="dash", line_color="red", row=3, col=1)
 
-# Add threshold lines
-fig_z.add_hline(y=2.0, line_dash="dash", line_color="red", annotation_text="+2σ")
-fig_z.add_hline(y=-2.0, line_dash="dash", line_color="red", annotation_text="-2σ")
-fig_z.add_hline(y=0, line_dash="dot", line_color="gray")
-fig_z.update_layout(height=400, yaxis_title="Z-Score (σ)")
-st.plotly_chart(fig_z, use_container_width=True)
-
-# ── CUSUM ──
-st.subheader("CUSUM — Persistent Shift Detection (RPI)")
-
-rpi_snapshots = [
-    s for s in snapshots if s.index_type == IndexType.RPI and s.cusum_upper is not None
-]
-if rpi_snapshots:
-    fig_c = go.Figure()
-    fig_c.add_trace(
-        go.Scatter(
-            x=[s.date for s in rpi_snapshots],
-            y=[s.cusum_upper for s in rpi_snapshots],
-            name="C⁺ (Upper)",
-            line=dict(color="#e74c3c"),
+    # Row 4: lane health history
+    if history:
+        health_colors = {"STABLE": "#2ecc71", "WATCH": "#f39c12", "ACTIVE": "#e74c3c"}
+        fig.add_trace(
+            go.Bar(
+                x=[week for week, _, _ in history],
+                y=[total for _, total, _ in history],
+                marker_color=[
+                    health_colors.get(status, "gray") for _, _, status in history
+                ],
+                text=[status for _, _, status in history],
+                textposition="outside",
+                showlegend=False,
+            ),
+            row=4,
+            col=1,
         )
-    )
-    fig_c.add_trace(
-        go.Scatter(
-            x=[s.date for s in rpi_snapshots],
-            y=[s.cusum_lower for s in rpi_snapshots],
-            name="C⁻ (Lower)",
-            line=dict(color="#3498db"),
+        fig.add_hline(
+            y=4,
+            line_dash="dash",
+            line_color="orange",
+            annotation_text="WATCH threshold",
+            row=4,
+            col=1,
         )
-    )
-    fig_c.add_hline(
-        y=4.5, line_dash="dash", line_color="red", annotation_text="h=4.5 (alarm)"
-    )
-    fig_c.add_hline(y=-4.5, line_dash="dash", line_color="red")
-    fig_c.update_layout(height=350, yaxis_title="CUSUM Statistic")
-    st.plotly_chart(fig_c, use_container_width=True)
-else:
-    st.info("No CUSUM data available yet.")
-
-# ── Lane Health History ──
-st.subheader("Lane Health History")
-
-if health_history:
-    health_colors = {"STABLE": "#2ecc71", "WATCH": "#f39c12", "ACTIVE": "#e74c3c"}
-    fig_h = go.Figure()
-    fig_h.add_trace(
-        go.Bar(
-            x=[h.week_start for h in health_history],
-            y=[h.combined_total for h in health_history],
-            marker_color=[
-                health_colors.get(h.health_status.value, "gray") for h in health_history
-            ],
-            text=[h.health_status.value for h in health_history],
-            textposition="outside",
+        fig.add_hline(
+            y=8,
+            line_dash="dash",
+            line_color="red",
+            annotation_text="ACTIVE threshold",
+            row=4,
+            col=1,
         )
-    )
-    fig_h.add_hline(
-        y=4, line_dash="dash", line_color="orange", annotation_text="WATCH threshold"
-    )
-    fig_h.add_hline(
-        y=8, line_dash="dash", line_color="red", annotation_text="ACTIVE threshold"
-    )
-    fig_h.update_layout(height=350, yaxis_title="Combined Total", xaxis_title="Week")
-    st.plotly_chart(fig_h, use_container_width=True)
-else:
+
+    fig.update_yaxes(title_text="Weighted Total", row=1, col=1)
+    fig.update_yaxes(title_text="Z-Score (σ)", row=2, col=1)
+    fig.update_yaxes(title_text="CUSUM Statistic", row=3, col=1)
+    fig.update_yaxes(title_text="Combined Total", row=4, col=1)
+    fig.update_xaxes(title_text="Week", row=4, col=1)
+    fig.update_layout(height=1300)
+    return fig.to_dict()
+
+
+history = tuple(
+    (h.week_start, h.combined_total, h.health_status.value) for h in health_history
+)
+st.plotly_chart(build_dashboard_fig(buckets, cusum, history), use_container_width=True)
+
+if not health_history:
     st.info("No lane health history available.")
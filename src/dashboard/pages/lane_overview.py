@@ -87,6 +87,7 @@ with st.expander("Data Refresh", expanded=False):
             status.update(label="Collectors and pipeline completed", state="complete")
             st.success("Data refresh complete.")
             st.code("\n".join(out_pipe.splitlines()[-60:]))
+            st.cache_data.clear()  # drop cached queries so the rerun sees new data
             st.rerun()
 
     if run_pipeline_only:
@@ -103,64 +104,102 @@ with st.expander("Data Refresh", expanded=False):
             status.update(label="Pipeline completed", state="complete")
             st.success("Pipeline completed and lane health updated.")
             st.code("\n".join(out_pipe.splitlines()[-60:]))
+            st.cache_data.clear()  # drop cached queries so the rerun sees new data
             st.rerun()
 
 
-async def get_latest_health():
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_lane_id(lane_name: str = "UK-India") -> int | None:
+    """Resolve the lane's primary key once per hour.
+
+    Every query on this page filtered by TradeLane.name through a join;
+    the lane id never changes, so caching it lets the queries below hit
+    their composite (trade_lane_id, ...) indexes directly with no
+    dimension-table join at all.
+    """
+
+    async def _fetch() -> int | None:
+        async with async_session() as session:
+            result = await session.execute(
+                select(TradeLane.id).where(TradeLane.name == lane_name)
+            )
+            return result.scalar_one_or_none()
+
+    return asyncio.run(_fetch())
+
+
+async def get_latest_health(lane_id: int):
     async with async_session() as session:
         result = await session.execute(
-            select(LaneHealth)
-            .join(TradeLane)
-            .where(TradeLane.name == "UK-India")
+            select(
+                LaneHealth.health_status,
+                LaneHealth.rpi_total,
+                LaneHealth.lsi_total,
+                LaneHealth.cpi_total,
+            )
+            .where(LaneHealth.trade_lane_id == lane_id)
             .order_by(LaneHealth.week_end.desc())
             .limit(1)
         )
-        return result.scalar_one_or_none()
+        return result.first()
 
 
-async def get_week_events():
+async def get_week_events(lane_id: int):
     today = date.today()
     week_start = today - timedelta(days=today.weekday())
     async with async_session() as session:
+        # Plain column rows, not ORM objects: cheaper to hydrate and safe to
+        # pickle into the Streamlit cache.
         result = await session.execute(
-            select(Event)
-            .join(TradeLane)
-            .where(TradeLane.name == "UK-India")
+            select(
+                Event.date_observed,
+                Event.source_name,
+                Event.event_type,
+                Event.event_description,
+                Event.event_status,
+                Event.confidence_level,
+                Event.impact_pathway,
+                Event.index_impact,
+                Event.index_delta,
+                Event.analyst_notes,
+            )
+            .where(Event.trade_lane_id == lane_id)
             .where(Event.date_observed >= week_start)
             .order_by(Event.date_observed.desc())
+            .limit(10)
         )
-        return result.scalars().all()
+        return result.all()
 
 
-async def get_index_totals():
+async def get_index_totals(lane_id: int):
     today = date.today()
     week_start = today - timedelta(days=today.weekday())
     async with async_session() as session:
-        totals = {}
-        for idx in [IndexType.RPI, IndexType.LSI, IndexType.CPI]:
-            result = await session.execute(
-                select(func.coalesce(func.sum(Event.index_delta), 0))
-                .join(TradeLane)
-                .where(TradeLane.name == "UK-India")
-                .where(Event.date_observed >= week_start)
-                .where(Event.index_impact == idx)
-            )
-            totals[idx.value] = result.scalar()
+        # One grouped query instead of a round-trip per index.
+        result = await session.execute(
+            select(Event.index_impact, func.sum(Event.index_delta))
+            .where(Event.trade_lane_id == lane_id)
+            .where(Event.date_observed >= week_start)
+            .group_by(Event.index_impact)
+        )
+        totals = {idx.value: 0 for idx in [IndexType.RPI, IndexType.LSI, IndexType.CPI]}
+        for index_impact, total in result.all():
+            totals[index_impact.value] = total
         return totals
 
 
-async def get_run_health(window: int = 25) -> dict:
+async def get_run_health(lane_id: int, window: int = 25) -> dict:
     async with async_session() as session:
         result = await session.execute(
-            select(PipelineRun)
-            .join(TradeLane, PipelineRun.trade_lane_id == TradeLane.id, isouter=True)
+            select(PipelineRun.status, PipelineRun.started_at)
             .where(
-                (TradeLane.name == "UK-India") | (PipelineRun.trade_lane_id.is_(None))
+                (PipelineRun.trade_lane_id == lane_id)
+                | (PipelineRun.trade_lane_id.is_(None))
             )
             .order_by(PipelineRun.started_at.desc())
             .limit(window)
         )
-        runs = list(result.scalars().all())
+        runs = result.all()
 
     total = len(runs)
     successful = sum(1 for run in runs if run.status == RunStatus.SUCCESS)
@@ -178,12 +217,28 @@ async def get_run_health(window: int = 25) -> dict:
     }
 
 
+async def load_all(lane_id: int):
+    # The queries are independent; overlapping them collapses four serial
+    # round-trips to the cloud DB into roughly one. Each coroutine opens
+    # its own session, so asyncpg can multiplex them.
+    return await asyncio.gather(
+        get_latest_health(lane_id),
+        get_week_events(lane_id),
+        get_index_totals(lane_id),
+        get_run_health(lane_id),
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_page_data(lane_id: int):
+    """Cached page data; reruns within the TTL skip the DB entirely."""
+    return asyncio.run(load_all(lane_id))
+
+
 # Run async queries
 try:
-    health = asyncio.run(get_latest_health())
-    events = asyncio.run(get_week_events())
-    totals = asyncio.run(get_index_totals())
-    run_health = asyncio.run(get_run_health())
+    lane_id = get_lane_id()
+    health, events, totals, run_health = load_page_data(lane_id)
 except Exception as e:
     st.error(f"Database connection error: {e}")
     st.info(
@@ -194,20 +249,26 @@ except Exception as e:
 # ── Lane Health Badge ──
 col1, col2, col3, col4 = st.columns(4)
 
-if health:
+@st.cache_data(show_spinner=False)
+def badge_html(status_value: str) -> str:
+    """Health badge markup, cached per status so reruns hand Streamlit the
+    same string object instead of rebuilding and re-hashing the blob."""
     color_map = {
-        HealthStatus.STABLE: "green",
-        HealthStatus.WATCH: "orange",
-        HealthStatus.ACTIVE: "red",
+        HealthStatus.STABLE.value: "green",
+        HealthStatus.WATCH.value: "orange",
+        HealthStatus.ACTIVE.value: "red",
     }
-    status = health.health_status
-    col1.metric("Lane Health", status.value)
-    col1.markdown(
-        f'<div style="background-color:{color_map.get(status, "gray")}; '
+    return (
+        f'<div style="background-color:{color_map.get(status_value, "gray")}; '
         f"color:white; padding:10px; border-radius:5px; text-align:center; "
-        f'font-size:24px; font-weight:bold;">{status.value}</div>',
-        unsafe_allow_html=True,
+        f'font-size:24px; font-weight:bold;">{status_value}</div>'
     )
+
+
+if health:
+    status = health.health_status
+    col1.metric("Lane Health", status.value)
+    col1.markdown(badge_html(status.value), unsafe_allow_html=True)
 else:
     col1.metric("Lane Health", "NO DATA")
     col1.info("Run the pipeline to generate lane health data.")
@@ -234,7 +295,7 @@ st.divider()
 st.subheader("This Week's Signals")
 
 if events:
-    for event in events[:10]:
+    for event in events:
         delta_icon = (
             "🔴" if event.index_delta > 0 else ("🟢" if event.index_delta < 0 else "⚪")
         )
@@ -255,16 +316,18 @@ else:
     st.info("No signals collected this week. Run the collectors to populate data.")
 
 # ── Attribution (if health data exists) ──
-if health:
-    st.divider()
-    st.subheader("Weekly Attribution")
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def build_attribution_fig(rpi_total: int, lsi_total: int, cpi_total: int) -> dict:
+    """Cached figure dict, keyed on the three totals; st.plotly_chart takes
+    the dict directly, skipping Figure re-assembly and validation per rerun."""
     fig = go.Figure(
         data=[
             go.Bar(
                 name="Index Totals",
                 x=["RPI", "LSI", "CPI"],
-                y=[health.rpi_total, health.lsi_total, health.cpi_total],
+                y=[rpi_total, lsi_total, cpi_total],
                 marker_color=["#e74c3c", "#3498db", "#2ecc71"],
             )
         ]
@@ -272,4 +335,13 @@ if health:
     fig.update_layout(
         title="Index Contributions", yaxis_title="Delta Total", height=300
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_dict()
+
+
+if health:
+    st.divider()
+    st.subheader("Weekly Attribution")
+    st.plotly_chart(
+        build_attribution_fig(health.rpi_total, health.lsi_total, health.cpi_total),
+        use_container_width=True,
+    )
@@ -8,13 +8,15 @@ from datetime import date, timedelta
 
 import pandas as pd
 import streamlit as st
-from sqlalchemy import select
+from sqlalchemy import String, cast, func, select
 
 from src.db.models import (
     ConfidenceLevel,
     Event,
+    EventStatus,
     EventType,
     IndexType,
+    Jurisdiction,
     TradeLane,
 )
 from src.db.session import async_session
@@ -40,68 +42,129 @@ with col4:
 reviewed_only = st.checkbox("Show reviewed only", value=False)
 
 
-async def get_events():
-    start_date = date.today() - timedelta(days=days_back)
+# Column order matches DF_COLUMNS below. Enums are cast to plain strings
+# in SQL (their stored names) and the description truncated server-side;
+# the name → display-value fixups happen as dict-backed pandas maps.
+EVENT_COLUMNS = (
+    Event.date_observed,
+    Event.source_name,
+    cast(Event.event_type, String),
+    cast(Event.jurisdiction, String),
+    func.substr(Event.event_description, 1, 100),
+    cast(Event.event_status, String),
+    cast(Event.confidence_level, String),
+    Event.historical_precedent,
+    Event.impact_pathway,
+    cast(Event.index_impact, String),
+    Event.index_delta,
+    Event.reviewed,
+)
+
+# Stored enum name → display value, used to undo the SQL-side cast.
+_ENUM_DISPLAY = {
+    "Type": {e.name: e.value for e in EventType},
+    "Jurisdiction": {e.name: e.value for e in Jurisdiction},
+    "Status": {e.name: e.value for e in EventStatus},
+    "Confidence": {e.name: e.value for e in ConfidenceLevel},
+    "Index": {e.name: e.value for e in IndexType},
+}
+
+DF_COLUMNS = [
+    "Date",
+    "Source",
+    "Type",
+    "Jurisdiction",
+    "Description",
+    "Status",
+    "Confidence",
+    "Precedent",
+    "Pathway",
+    "Index",
+    "Delta",
+    "Reviewed",
+]
+
+
+async def get_events(days: int, indices, types, confidences, reviewed: bool):
+    start_date = date.today() - timedelta(days=days)
     async with async_session() as session:
         query = (
-            select(Event)
+            select(*EVENT_COLUMNS)
             .join(TradeLane)
             .where(TradeLane.name == "UK-India")
             .where(Event.date_observed >= start_date)
         )
-        if index_filter:
-            query = query.where(
-                Event.index_impact.in_([IndexType(v) for v in index_filter])
-            )
-        if type_filter:
+        if indices:
+            query = query.where(Event.index_impact.in_([IndexType(v) for v in indices]))
+        if types:
+            query = query.where(Event.event_type.in_([EventType(v) for v in types]))
+        if confidences:
             query = query.where(
-                Event.event_type.in_([EventType(v) for v in type_filter])
+                Event.confidence_level.in_([ConfidenceLevel(v) for v in confidences])
             )
-        if confidence_filter:
-            query = query.where(
-                Event.confidence_level.in_(
-                    [ConfidenceLevel(v) for v in confidence_filter]
-                )
-            )
-        if reviewed_only:
+        if reviewed:
             query = query.where(Event.reviewed.is_(True))
 
         query = query.order_by(Event.date_observed.desc())
         result = await session.execute(query)
-        return result.scalars().all()
-
-
-try:
-    events = asyncio.run(get_events())
-except Exception as e:
-    st.error(f"Database error: {e}")
-    st.stop()
-
-if events:
-    data = []
-    for e in events:
-        data.append(
-            {
-                "Date": e.date_observed,
-                "Source": e.source_name,
-                "Type": e.event_type.value,
-                "Jurisdiction": e.jurisdiction.value,
-                "Description": e.event_description[:100],
-                "Status": e.event_status.value,
-                "Confidence": e.confidence_level.value,
-                "Precedent": "Yes" if e.historical_precedent else "No",
-                "Pathway": e.impact_pathway,
-                "Index": e.index_impact.value,
-                "Delta": e.index_delta,
-                "Reviewed": "Yes" if e.reviewed else "No",
-            }
+        return result.all()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_events_df(
+    days: int, indices: tuple, types: tuple, confidences: tuple, reviewed: bool
+) -> pd.DataFrame:
+    """Cached per filter combination; the DataFrame is what gets cached, so
+    ORM objects never cross the cache boundary.
+
+    Rows go straight into from_records — no per-row dict building; pandas
+    assembles the columns in C.
+    """
+    rows = asyncio.run(get_events(days, indices, types, confidences, reviewed))
+    df = pd.DataFrame.from_records(rows, columns=DF_COLUMNS)
+    if not df.empty:
+        for col, mapping in _ENUM_DISPLAY.items():
+            df[col] = df[col].map(mapping)
+        df["Precedent"] = df["Precedent"].map({True: "Yes", False: "No"})
+        df["Reviewed"] = df["Reviewed"].map({True: "Yes", False: "No"})
+    return df
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def to_csv_bytes(frame: pd.DataFrame) -> bytes:
+    """Cached CSV serialization; reruns (filter ticks, widget clicks) reuse
+    the encoded bytes instead of re-serializing the whole table each time."""
+    return frame.to_csv(index=False, lineterminator="\n").encode("utf-8")
+
+
+@st.fragment
+def render_results(
+    days: int, indices: tuple, types: tuple, confidences: tuple, reviewed: bool
+) -> None:
+    """Results table and export, isolated in a fragment: interactions that
+    originate inside it (the download click) rerun only this block instead
+    of the whole page."""
+    try:
+        df = load_events_df(days, indices, types, confidences, reviewed)
+    except Exception as e:
+        st.error(f"Database error: {e}")
+        return
+
+    if not df.empty:
+        st.dataframe(df, use_container_width=True, height=500)
+
+        # Export
+        st.download_button(
+            "Download CSV", to_csv_bytes(df), "advuman_signals.csv", "text/csv"
         )
+    else:
+        st.info("No signals found for the selected filters.")
 
-    df = pd.DataFrame(data)
-    st.dataframe(df, use_container_width=True, height=500)
 
-    # Export
-    csv = df.to_csv(index=False)
-    st.download_button("Download CSV", csv, "advuman_signals.csv", "text/csv")
-else:
-    st.info("No signals found for the selected filters.")
+render_results(
+    days_back,
+    tuple(index_filter),
+    tuple(type_filter),
+    tuple(confidence_filter),
+    reviewed_only,
+)
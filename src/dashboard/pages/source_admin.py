@@ -25,11 +25,13 @@ import src.collectors.cpi.forwarder_posts  # noqa: F401
 
 from src.collectors.registry import get_collector, list_collectors
 from src.collectors.source_config import SourceOverride, load_source_overrides
-from src.config import settings
+from src.config import get_settings
 from src.db.models import PipelineRun, TradeLane
 from src.db.session import async_session
 from sqlalchemy import select
 
+settings = get_settings()
+
 st.title("Source Admin")
 st.caption(
     "Current source configuration resolved from Google Sheets CSV and collector defaults."
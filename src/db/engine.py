@@ -4,11 +4,37 @@ from sqlalchemy import pool
 def get_async_engine_options(database_url: str) -> dict:
     options: dict = {"echo": False}
 
-    if (
-        database_url.startswith("postgresql+asyncpg")
-        and "pooler.supabase.com" in database_url
-    ):
-        options["poolclass"] = pool.NullPool
-        options["connect_args"] = {"statement_cache_size": 0}
+    if database_url.startswith("postgresql+asyncpg"):
+        if "pooler.supabase.com" in database_url:
+            # Supabase's transaction pooler multiplexes server connections,
+            # so client-side pooling and prepared-statement caching must
+            # stay off.
+            options["poolclass"] = pool.NullPool
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                # The dashboard's queries are short; JIT compilation costs
+                # more than it saves on them.
+                "server_settings": {"jit": "off"},
+            }
+        else:
+            # Direct Postgres: keep a warm LIFO pool so repeat queries reuse
+            # the most-recently-used (still-authenticated) connections, with
+            # a pre-ping to evict ones the server has dropped. Recycle
+            # connections before typical idle-timeout windows close them
+            # server-side.
+            options["pool_size"] = 8
+            options["max_overflow"] = 10
+            options["pool_pre_ping"] = True
+            options["pool_use_lifo"] = True
+            options["pool_recycle"] = 1800
+            # The dashboard replays the same handful of parameterized
+            # queries every rerun; generous statement caches keep them
+            # prepared server-side so repeat executions skip PREPARE.
+            # (The pooler branch must stay at 0 — pgbouncer in transaction
+            # mode can't track prepared statements.)
+            options["connect_args"] = {
+                "statement_cache_size": 200,
+                "prepared_statement_cache_size": 200,
+            }
 
     return options
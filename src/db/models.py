@@ -8,10 +8,13 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -91,6 +94,20 @@ class RunStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+def _enum(enum_cls: type[enum.Enum]) -> Enum:
+    """Enum column type with per-row Python validation switched off.
+
+    validate_strings=False skips re-validating string binds and
+    create_constraint=False drops the CHECK constraint emitted for
+    non-native dialects (SQLite) — membership is already enforced by the
+    Python enum at the edges. Stored representation (member names, native
+    Postgres enum types) is unchanged, so no data migration is needed.
+    """
+    return Enum(
+        enum_cls, native_enum=True, validate_strings=False, create_constraint=False
+    )
+
+
 # ── Models ───────────────────────────────────────────────────────────────────
 
 
@@ -101,7 +118,7 @@ class TradeLane(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)  # e.g. "UK-India"
     sector: Mapped[str] = mapped_column(String(100), nullable=False)  # e.g. "Textiles"
     status: Mapped[LaneStatus] = mapped_column(
-        Enum(LaneStatus), default=LaneStatus.ACTIVE
+        _enum(LaneStatus), default=LaneStatus.ACTIVE
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -127,10 +144,12 @@ class OsintSource(Base):
     trade_lane_id: Mapped[int] = mapped_column(ForeignKey("trade_lanes.id"))
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     url: Mapped[str] = mapped_column(String(500), nullable=False)
-    source_layer: Mapped[SourceLayer] = mapped_column(Enum(SourceLayer), nullable=False)
-    primary_index: Mapped[IndexType] = mapped_column(Enum(IndexType), nullable=False)
+    source_layer: Mapped[SourceLayer] = mapped_column(
+        _enum(SourceLayer), nullable=False
+    )
+    primary_index: Mapped[IndexType] = mapped_column(_enum(IndexType), nullable=False)
     check_frequency: Mapped[CheckFrequency] = mapped_column(
-        Enum(CheckFrequency), nullable=False
+        _enum(CheckFrequency), nullable=False
     )
     source_weight: Mapped[float] = mapped_column(Float, nullable=False)
 
@@ -142,30 +161,50 @@ class Event(Base):
     """Core 18-column OSINT event log — matches the Excel framework exactly."""
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Every page query filters by lane + date (often + index); the
+        # composite index keeps those range scans off a growing seq scan.
+        Index(
+            "ix_events_lane_date_index",
+            "trade_lane_id",
+            "date_observed",
+            "index_impact",
+        ),
+        # Partial index for the signal-log "reviewed only" filter.
+        Index(
+            "ix_events_reviewed_true",
+            "reviewed",
+            postgresql_where=text("reviewed IS TRUE"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     trade_lane_id: Mapped[int] = mapped_column(ForeignKey("trade_lanes.id"))
     source_id: Mapped[int] = mapped_column(ForeignKey("osint_sources.id"))
 
     # Columns 1-4: Source identification
-    date_observed: Mapped[date] = mapped_column(Date, nullable=False)
-    source_layer: Mapped[SourceLayer] = mapped_column(Enum(SourceLayer), nullable=False)
+    date_observed: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    source_layer: Mapped[SourceLayer] = mapped_column(
+        _enum(SourceLayer), nullable=False
+    )
     source_name: Mapped[str] = mapped_column(String(200), nullable=False)
     source_url: Mapped[str] = mapped_column(String(500), nullable=False)
 
     # Columns 5-9: Event classification
-    event_type: Mapped[EventType] = mapped_column(Enum(EventType), nullable=False)
+    event_type: Mapped[EventType] = mapped_column(_enum(EventType), nullable=False)
     jurisdiction: Mapped[Jurisdiction] = mapped_column(
-        Enum(Jurisdiction), nullable=False
+        _enum(Jurisdiction), nullable=False
     )
     sector: Mapped[str] = mapped_column(String(100), nullable=False)
     affected_object: Mapped[str] = mapped_column(String(300), nullable=False)
     event_description: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Columns 10-12: Assessment
-    event_status: Mapped[EventStatus] = mapped_column(Enum(EventStatus), nullable=False)
+    event_status: Mapped[EventStatus] = mapped_column(
+        _enum(EventStatus), nullable=False
+    )
     confidence_level: Mapped[ConfidenceLevel] = mapped_column(
-        Enum(ConfidenceLevel), nullable=False
+        _enum(ConfidenceLevel), nullable=False
     )
     historical_precedent: Mapped[bool] = mapped_column(Boolean, nullable=False)
 
@@ -174,9 +213,14 @@ class Event(Base):
         String(200), nullable=False
     )  # "Cost", "Time", "Compliance;Time", etc.
     quant_metric_triggered: Mapped[str] = mapped_column(String(300), nullable=False)
-    index_impact: Mapped[IndexType] = mapped_column(Enum(IndexType), nullable=False)
+    index_impact: Mapped[IndexType] = mapped_column(_enum(IndexType), nullable=False)
     index_delta: Mapped[int] = mapped_column(Integer, nullable=False)  # +1, 0, -1
 
+    # Packed pathway bits (Cost=1, Time=2, Compliance=4, Availability=8),
+    # written at ingest so rollups skip re-splitting impact_pathway. NULL
+    # for free-text pathways and pre-existing rows.
+    pathway_mask: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     # Columns 17-18: Review
     analyst_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     reviewed: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -197,7 +241,12 @@ class Event(Base):
     )
 
     trade_lane: Mapped["TradeLane"] = relationship(back_populates="events")
-    source: Mapped["OsintSource"] = relationship(back_populates="events")
+    # Joined-eager: pages that surface source metadata per event would
+    # otherwise trigger a lazy-load SELECT per row (MissingGreenlet under
+    # the async engine).
+    source: Mapped["OsintSource"] = relationship(
+        back_populates="events", lazy="joined"
+    )
     weighted_score: Mapped["WeightedScore | None"] = relationship(
         back_populates="event", uselist=False
     )
@@ -228,11 +277,20 @@ class IndexSnapshot(Base):
     """Daily/weekly index values with EWMA baseline and CUSUM state."""
 
     __tablename__ = "index_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "trade_lane_id",
+            "date",
+            "index_type",
+            name="uq_index_snapshots_lane_date_index",
+        ),
+        Index("ix_snapshots_lane_date_type", "trade_lane_id", "date", "index_type"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     trade_lane_id: Mapped[int] = mapped_column(ForeignKey("trade_lanes.id"))
     date: Mapped[date] = mapped_column(Date, nullable=False)
-    index_type: Mapped[IndexType] = mapped_column(Enum(IndexType), nullable=False)
+    index_type: Mapped[IndexType] = mapped_column(_enum(IndexType), nullable=False)
 
     raw_total: Mapped[float] = mapped_column(Float, nullable=False)
     weighted_total: Mapped[float] = mapped_column(Float, nullable=False)
@@ -253,6 +311,12 @@ class LaneHealth(Base):
     """Weekly lane health status roll-up."""
 
     __tablename__ = "lane_health"
+    __table_args__ = (
+        UniqueConstraint(
+            "trade_lane_id", "week_start", name="uq_lane_health_lane_week"
+        ),
+        Index("ix_lane_health_lane_week_end", "trade_lane_id", "week_end"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     trade_lane_id: Mapped[int] = mapped_column(ForeignKey("trade_lanes.id"))
@@ -264,14 +328,18 @@ class LaneHealth(Base):
     cpi_total: Mapped[float] = mapped_column(Float, nullable=False)
     combined_total: Mapped[float] = mapped_column(Float, nullable=False)
     health_status: Mapped[HealthStatus] = mapped_column(
-        Enum(HealthStatus), nullable=False
+        _enum(HealthStatus), nullable=False
     )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
 
-    trade_lane: Mapped["TradeLane"] = relationship(back_populates="lane_health_records")
+    # Joined-eager by default: under the async engine an implicit lazy load
+    # raises MissingGreenlet, and a many-to-one resolves in the same SELECT.
+    trade_lane: Mapped["TradeLane"] = relationship(
+        back_populates="lane_health_records", lazy="joined"
+    )
 
 
 class PipelineRun(Base):
@@ -288,7 +356,7 @@ class PipelineRun(Base):
         String(30), nullable=False, default="collectors+pipeline"
     )
     status: Mapped[RunStatus] = mapped_column(
-        Enum(RunStatus), nullable=False, default=RunStatus.STARTED
+        _enum(RunStatus), nullable=False, default=RunStatus.STARTED
     )
     started_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
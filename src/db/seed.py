@@ -2,11 +2,13 @@
 
 import asyncio
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import (
     CheckFrequency,
+    ConfidenceLevel,
+    EventStatus,
     IndexType,
     LaneStatus,
     OsintSource,
@@ -26,15 +28,15 @@ SOURCE_WEIGHTS = {
 }
 
 STATUS_WEIGHTS = {
-    "Enforced": 1.0,
-    "Announced": 0.7,
-    "Draft": 0.4,
+    EventStatus.ENFORCED: 1.0,
+    EventStatus.ANNOUNCED: 0.7,
+    EventStatus.DRAFT: 0.4,
 }
 
 CONFIDENCE_WEIGHTS = {
-    "High": 0.9,
-    "Medium": 0.6,
-    "Low": 0.3,
+    ConfidenceLevel.HIGH: 0.9,
+    ConfidenceLevel.MEDIUM: 0.6,
+    ConfidenceLevel.LOW: 0.3,
 }
 
 PRECEDENT_WEIGHTS = {
@@ -155,17 +157,21 @@ async def seed_uk_india(session: AsyncSession) -> None:
     session.add(lane)
     await session.flush()  # Get lane.id
 
-    for src_data in UK_INDIA_SOURCES:
-        source = OsintSource(
-            trade_lane_id=lane.id,
-            name=src_data["name"],
-            url=src_data["url"],
-            source_layer=src_data["source_layer"],
-            primary_index=src_data["primary_index"],
-            check_frequency=src_data["check_frequency"],
-            source_weight=SOURCE_WEIGHTS[src_data["source_layer"]],
-        )
-        session.add(source)
+    # Single executemany INSERT instead of 12 ORM instances — the unit-of-work
+    # would otherwise flush these one statement at a time.
+    rows = [
+        {
+            "trade_lane_id": lane.id,
+            "name": src_data["name"],
+            "url": src_data["url"],
+            "source_layer": src_data["source_layer"],
+            "primary_index": src_data["primary_index"],
+            "check_frequency": src_data["check_frequency"],
+            "source_weight": SOURCE_WEIGHTS[src_data["source_layer"]],
+        }
+        for src_data in UK_INDIA_SOURCES
+    ]
+    await session.execute(insert(OsintSource), rows)
 
     await session.commit()
     print(f"Seeded UK-India Textiles lane with {len(UK_INDIA_SOURCES)} sources.")
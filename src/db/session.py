@@ -1,14 +1,35 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.config import settings
+from src.config import get_settings
 from src.db.engine import get_async_engine_options
 
+_database_url = get_settings().database_url
 engine = create_async_engine(
-    settings.database_url, **get_async_engine_options(settings.database_url)
+    _database_url, **get_async_engine_options(_database_url)
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
-async def get_session() -> AsyncSession:
+async def get_session() -> AsyncIterator[AsyncSession]:
     async with async_session() as session:
         yield session
+
+
+async def warmup_pool(concurrency: int = 5) -> None:
+    """Open ``concurrency`` pooled connections up front and return them.
+
+    Against the cloud database each fresh connection pays TCP + TLS + auth
+    (hundreds of ms); opening a handful concurrently before concurrent work
+    starts means the first real queries check out already-established
+    connections instead of racing to build their own.
+    """
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(concurrency)))
@@ -0,0 +1,49 @@
+"""Event-loop level DNS cache.
+
+Collectors and DB probes repeatedly resolve the same handful of hosts within
+one CLI invocation. Wrapping ``loop.getaddrinfo`` with a short-TTL in-memory
+cache turns repeat lookups into dict hits instead of resolver round-trips.
+"""
+
+import asyncio
+import time
+
+DEFAULT_TTL_SECONDS = 300.0
+
+_cache: dict[tuple, tuple[float, list]] = {}
+
+
+def install_dns_cache(
+    loop: asyncio.AbstractEventLoop | None = None,
+    ttl: float = DEFAULT_TTL_SECONDS,
+) -> None:
+    """Wrap the loop's getaddrinfo with a TTL-based in-memory cache.
+
+    Idempotent per loop: installing twice is a no-op.
+    """
+    loop = loop or asyncio.get_running_loop()
+    if getattr(loop, "_advuman_dns_cache", False):
+        return
+
+    original_getaddrinfo = loop.getaddrinfo
+
+    async def cached_getaddrinfo(host, port, *, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        hit = _cache.get(key)
+        now = time.monotonic()
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        result = await original_getaddrinfo(
+            host, port, family=family, type=type, proto=proto, flags=flags
+        )
+        _cache[key] = (now + ttl, result)
+        return result
+
+    loop.getaddrinfo = cached_getaddrinfo
+    loop._advuman_dns_cache = True
+
+
+def clear_dns_cache() -> None:
+    """Drop all cached resolutions (mainly for tests)."""
+    _cache.clear()
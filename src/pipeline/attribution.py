@@ -9,17 +9,63 @@ Attribution dimensions:
     - By Jurisdiction: India % | UK % | Bilateral %
 """
 
-from collections import defaultdict
+import numpy as np
+
+from src.db.models import Jurisdiction, SourceLayer
+
+# Labels in enum declaration order; integer codes passed in must follow the
+# same order (scoring.SOURCE_LAYER_CODES is built the same way).
+SOURCE_LAYER_LABELS = [member.value for member in SourceLayer]
+JURISDICTION_LABELS = [member.value for member in Jurisdiction]
+
+JURISDICTION_CODES = {member: code for code, member in enumerate(Jurisdiction)}
+
+# Canonical pathway bits for the packed pathway_mask column. Events whose
+# pathway string is entirely canonical store the OR of these at write time,
+# so rollups skip re-splitting the string per event.
+PATHWAY_BITS = {"Cost": 1, "Time": 2, "Compliance": 4, "Availability": 8}
+_PATHWAY_BIT_VALUES = np.array(list(PATHWAY_BITS.values()), dtype=np.int64)
+
+_EMPTY = {"source_layer": {}, "impact_pathway": {}, "jurisdiction": {}}
+
+
+def pathway_mask(pathway: str) -> int | None:
+    """Pack a semicolon-separated pathway string into a bitmask.
+
+    Returns None when any component is non-canonical (free-text pathways
+    fall back to string parsing at rollup time).
+    """
+    mask = 0
+    for part in pathway.split(";"):
+        bit = PATHWAY_BITS.get(part.strip())
+        if bit is None:
+            return None
+        mask |= bit
+    return mask or None
 
 
 def compute_attribution(
-    events: list[dict],
+    weighted_scores: np.ndarray,
+    source_codes: np.ndarray,
+    jurisdiction_codes: np.ndarray,
+    impact_pathways: list[str],
+    pathway_masks: np.ndarray | None = None,
 ) -> dict[str, dict[str, float]]:
     """Compute attribution percentages across three dimensions.
 
+    Struct-of-arrays interface: each per-event fact arrives as its own array
+    so every dimension reduces in a single C-level ``np.bincount`` instead of
+    N Python dict updates.
+
     Args:
-        events: List of dicts with keys: weighted_score, source_layer,
-                impact_pathway (semicolon-separated), jurisdiction
+        weighted_scores: Per-event weighted scores (signs are ignored).
+        source_codes: Integer codes into SourceLayer declaration order.
+        jurisdiction_codes: Integer codes into Jurisdiction declaration order.
+        impact_pathways: Raw pathway strings, semicolon-separated when
+            multi-valued (e.g. "Compliance;Time").
+        pathway_masks: Optional packed pathway bitmasks (0 where absent);
+            rows with a mask are reduced branchlessly over the four
+            canonical bits, skipping the per-event split entirely.
 
     Returns:
         {
@@ -28,29 +74,62 @@ def compute_attribution(
             "jurisdiction": {"India": 0.60, "UK": 0.40, ...},
         }
     """
-    total_abs = sum(abs(e["weighted_score"]) for e in events)
+    abs_scores = np.abs(np.asarray(weighted_scores, dtype=np.float64))
+    total_abs = abs_scores.sum()
     if total_abs == 0:
-        return {"source_layer": {}, "impact_pathway": {}, "jurisdiction": {}}
-
-    by_source: dict[str, float] = defaultdict(float)
-    by_pathway: dict[str, float] = defaultdict(float)
-    by_jurisdiction: dict[str, float] = defaultdict(float)
-
-    for e in events:
-        abs_score = abs(e["weighted_score"])
+        return {dim: {} for dim in _EMPTY}
 
-        by_source[e["source_layer"]] += abs_score
+    source_sums = np.bincount(
+        source_codes, weights=abs_scores, minlength=len(SOURCE_LAYER_LABELS)
+    )
+    jurisdiction_sums = np.bincount(
+        jurisdiction_codes, weights=abs_scores, minlength=len(JURISDICTION_LABELS)
+    )
 
-        # Impact pathway can be multi-valued: "Compliance;Time"
-        pathways = [p.strip() for p in e["impact_pathway"].split(";")]
-        per_pathway = abs_score / len(pathways)
-        for p in pathways:
-            by_pathway[p] += per_pathway
+    # Impact pathway can be multi-valued. Rows carrying a packed bitmask
+    # reduce in four vector operations; only rows without one (legacy or
+    # free-text pathways) fall back to splitting the string.
+    pathway_totals: dict[str, float] = {}
+    if pathway_masks is not None:
+        masks = np.asarray(pathway_masks, dtype=np.int64)
+        packed = masks > 0
+        if packed.any():
+            present = (masks[packed, None] & _PATHWAY_BIT_VALUES) > 0
+            per_pathway = abs_scores[packed] / present.sum(axis=1)
+            bit_sums = present.T @ per_pathway
+            for label, bit_sum in zip(PATHWAY_BITS, bit_sums):
+                if bit_sum:
+                    pathway_totals[label] = float(bit_sum)
+        unpacked = (
+            (abs_score, pathway)
+            for abs_score, pathway, has_mask in zip(
+                abs_scores, impact_pathways, packed
+            )
+            if not has_mask
+        )
+    else:
+        unpacked = zip(abs_scores, impact_pathways)
 
-        by_jurisdiction[e["jurisdiction"]] += abs_score
+    for abs_score, pathway in unpacked:
+        parts = [p.strip() for p in pathway.split(";")]
+        per_pathway = abs_score / len(parts)
+        for part in parts:
+            pathway_totals[part] = pathway_totals.get(part, 0.0) + per_pathway
 
     return {
-        "source_layer": {k: v / total_abs for k, v in by_source.items()},
-        "impact_pathway": {k: v / total_abs for k, v in by_pathway.items()},
-        "jurisdiction": {k: v / total_abs for k, v in by_jurisdiction.items()},
+        "source_layer": {
+            label: total / total_abs
+            for label, total in zip(SOURCE_LAYER_LABELS, source_sums)
+            if total
+        },
+        "impact_pathway": {
+            label: total / total_abs
+            for label, total in pathway_totals.items()
+            if total
+        },
+        "jurisdiction": {
+            label: total / total_abs
+            for label, total in zip(JURISDICTION_LABELS, jurisdiction_sums)
+            if total
+        },
     }
@@ -9,35 +9,42 @@ Lower CUSUM: C⁻_t = min(0, C⁻_{t-1} + z_t + k)
 Alert when C⁺ > h or |C⁻| > h.
 """
 
-from dataclasses import dataclass
-
-
-@dataclass
-class CUSUMState:
-    upper: float = 0.0
-    lower: float = 0.0
+class CUSUMDetector:
+    """Track CUSUM statistics for a single index.
 
+    State is held as two plain float attributes rather than a state object:
+    long backfills call update() thousands of times and a per-detector
+    dataclass was pure allocator churn. __slots__ drops the per-instance
+    __dict__, which matters when a detector exists per (source, index).
+    """
 
-class CUSUMDetector:
-    """Track CUSUM statistics for a single index."""
+    __slots__ = ("k", "h", "upper", "lower")
 
     def __init__(self, k: float = 0.5, h: float = 4.5):
         self.k = k  # Reference value (sensitivity to 1-sigma shifts)
         self.h = h  # Control limit (alarm threshold)
-        self.state = CUSUMState()
+        self.upper = 0.0
+        self.lower = 0.0
 
-    def update(self, z_score: float) -> tuple[CUSUMState, bool]:
+    def update(self, z_score: float) -> tuple[float, float, bool]:
         """Update CUSUM with new z-score observation.
 
         Returns:
-            (state, alarm) — current CUSUM state and whether threshold is breached.
+            (upper, lower, alarm) — current CUSUM statistics and whether
+            the threshold is breached.
         """
-        self.state.upper = max(0.0, self.state.upper + z_score - self.k)
-        self.state.lower = min(0.0, self.state.lower + z_score + self.k)
+        # Hoisted to locals: one attribute read/write per statistic instead
+        # of repeated self. traffic in the per-tick hot path.
+        upper = self.upper + z_score - self.k
+        upper = upper if upper > 0.0 else 0.0
+        lower = self.lower + z_score + self.k
+        lower = lower if lower < 0.0 else 0.0
+        self.upper = upper
+        self.lower = lower
 
-        alarm = self.state.upper > self.h or abs(self.state.lower) > self.h
-        return self.state, alarm
+        return upper, lower, upper > self.h or -lower > self.h
 
     def reset(self) -> None:
         """Reset CUSUM after alarm or manual intervention."""
-        self.state = CUSUMState()
+        self.upper = 0.0
+        self.lower = 0.0
@@ -10,32 +10,103 @@ Default H=14 days → λ ≈ 0.048
 """
 
 import math
+from functools import lru_cache
 
+import numpy as np
 
+# The batch kernel is jitted when numba is installed; it is not a project
+# dependency, so environments without it run the same function as plain
+# Python (still one call per backfill rather than one per observation).
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+@lru_cache(maxsize=None)
 def lambda_from_halflife(half_life_days: float) -> float:
-    """Convert half-life in days to EWMA decay parameter lambda."""
+    """Convert half-life in days to EWMA decay parameter lambda.
+
+    Cached: detectors are built per series per run, and the handful of
+    half-lives in use each pay the pow() once per process. The tuned
+    per-index lambdas themselves live precomputed in Settings.
+    """
     return 1 - 2 ** (-1 / half_life_days)
 
 
 class EWMABaseline:
-    """Track EWMA mean and variance for a single index time series."""
+    """Track EWMA mean and variance for a single index time series.
+
+    __slots__ keeps instances small: one baseline exists per (source, index)
+    series, so the per-instance __dict__ adds up across lanes.
+    """
+
+    __slots__ = ("lam", "one_minus_lam", "mean", "variance")
 
     def __init__(self, lam: float = 0.048):
         self.lam = lam
+        self.one_minus_lam = 1.0 - lam
         self.mean: float | None = None
         self.variance: float | None = None
 
-    def update(self, x: float) -> tuple[float, float]:
+    def update(self, x: float, need_sigma: bool = True) -> tuple[float, float | None]:
         """Update with new observation, return (mean, sigma).
 
         For the first observation, initializes mean=x and variance=0.
+        Callers that only consume the mean (diagnostics, plots) can pass
+        ``need_sigma=False`` to skip the sqrt; the variance recurrence
+        still advances so later sigmas stay correct, and sigma is
+        returned as None.
         """
         if self.mean is None:
             self.mean = x
             self.variance = 0.0
-            return self.mean, 0.0
+            return self.mean, 0.0 if need_sigma else None
 
-        self.mean = self.lam * x + (1 - self.lam) * self.mean
-        self.variance = self.lam * (x - self.mean) ** 2 + (1 - self.lam) * self.variance
-        sigma = math.sqrt(self.variance) if self.variance > 0 else 0.0
+        self.mean = self.lam * x + self.one_minus_lam * self.mean
+        self.variance = (
+            self.lam * (x - self.mean) ** 2 + self.one_minus_lam * self.variance
+        )
+        if not need_sigma:
+            return self.mean, None
+        sigma = math.sqrt(self.variance) if self.variance > 0.0 else 0.0
         return self.mean, sigma
+
+
+def _ewma_batch_kernel(
+    xs: np.ndarray, lam: float, means: np.ndarray, sigmas: np.ndarray
+) -> None:
+    mean = xs[0]
+    variance = 0.0
+    means[0] = mean
+    sigmas[0] = 0.0
+    for i in range(1, xs.shape[0]):
+        x = xs[i]
+        mean = lam * x + (1 - lam) * mean
+        variance = lam * (x - mean) ** 2 + (1 - lam) * variance
+        means[i] = mean
+        sigmas[i] = math.sqrt(variance) if variance > 0 else 0.0
+
+
+if njit is not None:  # pragma: no cover - exercised only with numba installed
+    _ewma_batch_kernel = njit(cache=True)(_ewma_batch_kernel)
+
+
+def ewma_batch(xs: np.ndarray, lam: float = 0.048) -> tuple[np.ndarray, np.ndarray]:
+    """Run the EWMA recurrence over a whole series in one call.
+
+    For backfills over months of history this replaces one
+    ``EWMABaseline.update`` call (attribute lookups, method dispatch) per
+    observation with a single kernel invocation; with numba installed the
+    loop compiles to machine code. Matches ``EWMABaseline`` element-wise,
+    including the mean=x, variance=0 initialization on the first value.
+
+    Returns:
+        (means, sigmas) float64 arrays, same length as ``xs``.
+    """
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    means = np.empty_like(xs)
+    sigmas = np.empty_like(xs)
+    if xs.size:
+        _ewma_batch_kernel(xs, lam, means, sigmas)
+    return means, sigmas
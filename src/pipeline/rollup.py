@@ -6,9 +6,26 @@ Lane Health Status Rules (from OSINT guides):
     Combined Total 8+   → ACTIVE
 """
 
-from src.config import settings
+import functools
+
+import numpy as np
+
+from src.config import get_settings
 from src.db.models import HealthStatus
 
+# Status by threshold-interval index: searchsorted over the (watch, active)
+# thresholds yields 0/1/2 directly, replacing the if/elif chain and
+# vectorizing over arrays of combined totals.
+_STATES = (HealthStatus.STABLE, HealthStatus.WATCH, HealthStatus.ACTIVE)
+
+
+@functools.lru_cache(maxsize=1)
+def _thresholds() -> np.ndarray:
+    settings = get_settings()
+    return np.array(
+        [settings.lane_health_watch, settings.lane_health_active], dtype=np.float64
+    )
+
 
 def compute_lane_health(
     rpi_total: float,
@@ -21,12 +38,24 @@ def compute_lane_health(
         (combined_total, health_status)
     """
     combined = rpi_total + lsi_total + cpi_total
+    status = _STATES[int(np.searchsorted(_thresholds(), combined, side="right"))]
+    return combined, status
 
-    if combined >= settings.lane_health_active:
-        status = HealthStatus.ACTIVE
-    elif combined >= settings.lane_health_watch:
-        status = HealthStatus.WATCH
-    else:
-        status = HealthStatus.STABLE
 
-    return combined, status
+def compute_lane_health_batch(
+    rpi_totals: np.ndarray,
+    lsi_totals: np.ndarray,
+    cpi_totals: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized lane health over arrays of weekly index totals.
+
+    Returns:
+        (combined_totals, status_indices) — status indices map into the
+        STABLE/WATCH/ACTIVE order of ``_STATES`` (0/1/2).
+    """
+    combined = (
+        np.asarray(rpi_totals, dtype=np.float64)
+        + np.asarray(lsi_totals, dtype=np.float64)
+        + np.asarray(cpi_totals, dtype=np.float64)
+    )
+    return combined, np.searchsorted(_thresholds(), combined, side="right")
@@ -3,6 +3,8 @@
 Formula: WeightedScore = Delta × SourceWeight × StatusWeight × ConfidenceWeight × PrecedentWeight
 """
 
+import numpy as np
+
 from src.db.models import ConfidenceLevel, EventStatus, SourceLayer
 from src.db.seed import (
     CONFIDENCE_WEIGHTS,
@@ -11,6 +13,37 @@ from src.db.seed import (
     STATUS_WEIGHTS,
 )
 
+# Integer code maps + weight lookup tables for the batch kernel. Code order
+# follows enum declaration order, so a code array indexes straight into the
+# matching weight table.
+SOURCE_LAYER_CODES = {layer: code for code, layer in enumerate(SourceLayer)}
+EVENT_STATUS_CODES = {status: code for code, status in enumerate(EventStatus)}
+CONFIDENCE_CODES = {level: code for code, level in enumerate(ConfidenceLevel)}
+
+_SOURCE_W = np.array([SOURCE_WEIGHTS[layer] for layer in SourceLayer])
+_STATUS_W = np.array([STATUS_WEIGHTS[status] for status in EventStatus])
+_CONFIDENCE_W = np.array([CONFIDENCE_WEIGHTS[level] for level in ConfidenceLevel])
+_PRECEDENT_W = np.array([PRECEDENT_WEIGHTS[False], PRECEDENT_WEIGHTS[True]])
+
+# Full weight matrix evaluated over the enum cross-product at import time
+# (4×3×3×2 floats), so scoring is a single table gather per event instead
+# of a four-factor multiplication chain.
+_WEIGHT_TABLE = (
+    _SOURCE_W[:, None, None, None]
+    * _STATUS_W[None, :, None, None]
+    * _CONFIDENCE_W[None, None, :, None]
+    * _PRECEDENT_W[None, None, None, :]
+)
+
+# Status × confidence × precedent sub-table for callers that supply the
+# source weight directly from the persisted OsintSource row (which may
+# diverge from the layer default once weights are tuned per source).
+_STATUS_CONF_PREC_TABLE = (
+    _STATUS_W[:, None, None]
+    * _CONFIDENCE_W[None, :, None]
+    * _PRECEDENT_W[None, None, :]
+)
+
 
 def compute_weighted_score(
     delta: int,
@@ -18,17 +51,52 @@ def compute_weighted_score(
     event_status: EventStatus,
     confidence_level: ConfidenceLevel,
     historical_precedent: bool,
+    source_weight: float | None = None,
 ) -> tuple[float, float, float, float, float]:
     """Compute the weighted score and return all component weights.
 
+    When the caller already holds the persisted ``OsintSource.source_weight``
+    it should pass it via ``source_weight``; the stored value is the
+    authoritative snapshot and may diverge from the layer default. Without
+    it, the weight falls back to the layer table.
+
     Returns:
         (weighted_score, source_w, status_w, confidence_w, precedent_w)
     """
-    source_w = SOURCE_WEIGHTS[source_layer]
-    status_w = STATUS_WEIGHTS[event_status.value]
-    confidence_w = CONFIDENCE_WEIGHTS[confidence_level.value]
-    precedent_w = PRECEDENT_WEIGHTS[historical_precedent]
+    stat = EVENT_STATUS_CODES[event_status]
+    conf = CONFIDENCE_CODES[confidence_level]
+    prec = int(historical_precedent)
+
+    if source_weight is None:
+        src = SOURCE_LAYER_CODES[source_layer]
+        source_weight = float(_SOURCE_W[src])
+
+    weighted_score = (
+        delta * source_weight * float(_STATUS_CONF_PREC_TABLE[stat, conf, prec])
+    )
 
-    weighted_score = delta * source_w * status_w * confidence_w * precedent_w
+    return (
+        weighted_score,
+        source_weight,
+        float(_STATUS_W[stat]),
+        float(_CONFIDENCE_W[conf]),
+        float(_PRECEDENT_W[prec]),
+    )
 
-    return weighted_score, source_w, status_w, confidence_w, precedent_w
+
+def compute_weighted_scores_batch(
+    deltas: np.ndarray,
+    source_codes: np.ndarray,
+    status_codes: np.ndarray,
+    confidence_codes: np.ndarray,
+    precedent_flags: np.ndarray,
+) -> np.ndarray:
+    """Vectorized weight-matrix formula over integer-coded event columns.
+
+    Each code array indexes the corresponding weight table (see the
+    *_CODES maps above); precedent_flags is 0/1 for novel/known.
+    Returns the weighted scores as a float array of the same length.
+    """
+    return deltas * _WEIGHT_TABLE[
+        source_codes, status_codes, confidence_codes, precedent_flags
+    ]
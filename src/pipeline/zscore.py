@@ -5,6 +5,8 @@ Formula: z_t = (x_t - μ_t) / σ_t
 Source: GSCPI (NY Fed) methodology — express deviation in sigma units.
 """
 
+import numpy as np
+
 
 def compute_zscore(value: float, ewma_mean: float, ewma_sigma: float) -> float | None:
     """Compute z-score relative to EWMA baseline.
@@ -14,3 +16,20 @@ def compute_zscore(value: float, ewma_mean: float, ewma_sigma: float) -> float |
     if ewma_sigma <= 0:
         return None
     return (value - ewma_mean) / ewma_sigma
+
+
+def compute_zscores(
+    values: np.ndarray, means: np.ndarray, sigmas: np.ndarray
+) -> np.ndarray:
+    """Branchless vector z-scores; 0.0 wherever sigma is non-positive.
+
+    The zero (rather than None/NaN) sentinel keeps downstream CUSUM
+    accumulation continuous: a zero z-score advances ``c_plus += z - k``
+    toward rest instead of forcing a per-tick None check.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    means = np.asarray(means, dtype=np.float64)
+    sigmas = np.asarray(sigmas, dtype=np.float64)
+    return np.divide(
+        values - means, sigmas, out=np.zeros_like(values), where=sigmas > 0
+    )
@@ -0,0 +1,81 @@
+"""Test the precompiled CSS-selector helper against BeautifulSoup."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.collectors import html
+
+SAMPLE = """
+<html><body>
+  <ul>
+    <li class="gem-c-document-list__item">
+      <a class="gem-c-document-list__item-title" href="/doc-1">Doc one</a>
+      <p class="gem-c-document-list__item-description">First description</p>
+      <ul class="gem-c-document-list__attribute"><time datetime="2026-01-05">5 Jan</time></ul>
+    </li>
+    <li class="item"><a href="/item">An item</a></li>
+  </ul>
+  <article>
+    <h2><a href="/post">Post title</a></h2>
+    <p class="excerpt">Post excerpt</p>
+    <time datetime="2026-02-01">1 Feb</time>
+  </article>
+  <div class="news-item"><h3>News</h3><p>News body</p></div>
+  <table>
+    <tr><td>Cell A</td><td>Cell B</td><td><a href="/case">Case</a></td></tr>
+  </table>
+  <a href="/report.pdf">PDF report</a>
+  <a href="/page.html">HTML page</a>
+</body></html>
+"""
+
+# Every selector shape the collectors use.
+SELECTORS = [
+    "li.gem-c-document-list__item",
+    "a.gem-c-document-list__item-title",
+    ".gem-c-document-list__item-description",
+    ".gem-c-document-list__attribute time",
+    "article, .news-item, .post-item, li.item",
+    "h2, h3, .title, a",
+    "h2 a, h3 a, .entry-title a",
+    "table tr, .notification-item, .views-row",
+    "td, .govuk-table__cell",
+    "a[href]",
+    "a[href$='.pdf']",
+    "p, .excerpt, .summary",
+    "time, .date, .meta",
+]
+
+
+@pytest.mark.parametrize("selector", SELECTORS)
+def test_select_matches_beautifulsoup(selector):
+    soup = BeautifulSoup(SAMPLE, "lxml")
+    tree = html.parse(SAMPLE)
+
+    expected = [el.get_text(strip=True) for el in soup.select(selector)]
+    actual = [html.text(el) for el in html.select(tree, selector)]
+
+    assert actual == expected
+
+
+def test_select_is_relative_to_element():
+    tree = html.parse(SAMPLE)
+    article = html.select_one(tree, "article")
+    links = html.select(article, "a[href]")
+    assert [el.get("href") for el in links] == ["/post"]
+
+
+def test_select_one_returns_first_in_document_order():
+    tree = html.parse(SAMPLE)
+    el = html.select_one(tree, "h2, h3, .title, a")
+    soup = BeautifulSoup(SAMPLE, "lxml")
+    assert html.text(el) == soup.select_one("h2, h3, .title, a").get_text(strip=True)
+
+
+def test_select_one_none_when_absent():
+    tree = html.parse(SAMPLE)
+    assert html.select_one(tree, ".does-not-exist") is None
+
+
+def test_compile_selector_is_cached():
+    assert html.compile_selector("a[href]") is html.compile_selector("a[href]")
@@ -0,0 +1,20 @@
+"""Tests for the raw-HTML keyword pre-scan."""
+
+from src.collectors import keyword_scan
+
+KEYWORDS = ("india", "blank", "service change")
+
+
+def test_contains_any_matches_case_insensitively():
+    assert keyword_scan.contains_any("<p>Blank sailings announced</p>", KEYWORDS)
+    assert keyword_scan.contains_any("UK-INDIA lane update", KEYWORDS)
+
+
+def test_contains_any_rejects_page_without_keywords():
+    assert not keyword_scan.contains_any("<html><body>Weather report</body></html>", KEYWORDS)
+
+
+def test_compiled_pattern_is_cached_per_keyword_tuple():
+    first = keyword_scan._compile(KEYWORDS)
+    second = keyword_scan._compile(KEYWORDS)
+    assert first is second
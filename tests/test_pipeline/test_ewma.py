@@ -39,3 +39,18 @@ def test_ewma_sigma_increases_with_volatility():
         _, sigma = ewma.update(val)
 
     assert sigma > 0
+
+
+def test_ewma_batch_matches_scalar_updates():
+    import numpy as np
+
+    from src.pipeline.ewma import ewma_batch
+
+    xs = np.array([5.0, 10.0, 0.0, 7.5, 3.0])
+    ewma = EWMABaseline(lam=0.1)
+    expected = [ewma.update(x) for x in xs]
+
+    means, sigmas = ewma_batch(xs, lam=0.1)
+    for i, (mean, sigma) in enumerate(expected):
+        assert means[i] == pytest.approx(mean)
+        assert sigmas[i] == pytest.approx(sigma)
@@ -0,0 +1,114 @@
+"""Test the fused per-index update kernel against the scalar trackers."""
+
+import numpy as np
+import pytest
+
+from src.pipeline.cusum import CUSUMDetector
+from src.pipeline.ewma import EWMABaseline
+from src.pipeline.kernels import update_indices
+from src.pipeline.zscore import compute_zscore
+
+
+def test_kernel_matches_scalar_trackers_over_history():
+    lam = np.array([0.05, 0.25, 0.1])
+    history = [
+        np.array([1.0, -2.0, 0.0]),
+        np.array([3.0, 1.5, 0.0]),
+        np.array([0.5, 4.0, -1.0]),
+        np.array([2.0, 2.0, 2.0]),
+    ]
+
+    ewmas = [EWMABaseline(lam=lam[i]) for i in range(3)]
+    detectors = [CUSUMDetector(k=0.5, h=4.5) for _ in range(3)]
+
+    prev_mean = np.full(3, np.nan)
+    prev_var = np.full(3, np.nan)
+    prev_upper = np.zeros(3)
+    prev_lower = np.zeros(3)
+
+    for x in history:
+        means, sigmas, zscores, uppers, lowers, _ = update_indices(
+            x, lam, prev_mean, prev_var, prev_upper, prev_lower, k=0.5, h=4.5
+        )
+
+        for i in range(3):
+            mean, sigma = ewmas[i].update(x[i])
+            assert means[i] == pytest.approx(mean)
+            assert sigmas[i] == pytest.approx(sigma)
+
+            z = compute_zscore(x[i], mean, sigma)
+            if z is None:
+                assert np.isnan(zscores[i])
+            else:
+                assert zscores[i] == pytest.approx(z)
+                upper, lower, _ = detectors[i].update(z)
+                assert uppers[i] == pytest.approx(upper)
+                assert lowers[i] == pytest.approx(lower)
+
+        # Thread state forward the way the pipeline does between weeks.
+        prev_mean = means
+        prev_var = sigmas**2
+        prev_upper = np.where(np.isnan(uppers), prev_upper, uppers)
+        prev_lower = np.where(np.isnan(lowers), prev_lower, lowers)
+
+
+def test_kernel_first_observation_initializes_baseline():
+    x = np.array([5.0])
+    means, sigmas, zscores, uppers, lowers, alarm = update_indices(
+        x,
+        np.array([0.1]),
+        np.full(1, np.nan),
+        np.full(1, np.nan),
+        np.zeros(1),
+        np.zeros(1),
+    )
+    assert means[0] == 5.0
+    assert sigmas[0] == 0.0
+    assert np.isnan(zscores[0])  # No deviation estimate yet
+    assert np.isnan(uppers[0]) and np.isnan(lowers[0])
+    assert not alarm[0]
+
+
+def test_kernel_alarm_on_persistent_shift():
+    lam = np.array([0.1])
+    prev_mean = np.array([0.0])
+    prev_var = np.array([1.0])
+    prev_upper = np.zeros(1)
+    prev_lower = np.zeros(1)
+    alarmed = False
+    for _ in range(20):
+        means, sigmas, zscores, uppers, lowers, alarm = update_indices(
+            np.array([3.0]), lam, prev_mean, prev_var, prev_upper, prev_lower
+        )
+        alarmed = alarmed or bool(alarm[0])
+        prev_mean, prev_var = means, sigmas**2
+        prev_upper, prev_lower = uppers, lowers
+    assert alarmed
+
+
+def test_batch_kernel_matches_scalar_trackers_over_series():
+    from src.pipeline.kernels import ewma_z_cusum_batch
+
+    xs = np.array([1.0, 3.0, 0.5, 2.0, -1.0, 4.0])
+    means, sigmas, zscores, uppers, lowers, alarms = ewma_z_cusum_batch(
+        xs, lam=0.1, k=0.5, h=4.5
+    )
+
+    ewma = EWMABaseline(lam=0.1)
+    detector = CUSUMDetector(k=0.5, h=4.5)
+    for i, x in enumerate(xs):
+        mean, sigma = ewma.update(x)
+        assert means[i] == pytest.approx(mean)
+        assert sigmas[i] == pytest.approx(sigma)
+
+        z = compute_zscore(x, mean, sigma)
+        if z is None:
+            assert np.isnan(zscores[i])
+            assert np.isnan(uppers[i])
+            assert not alarms[i]
+        else:
+            assert zscores[i] == pytest.approx(z)
+            upper, lower, alarm = detector.update(z)
+            assert uppers[i] == pytest.approx(upper)
+            assert lowers[i] == pytest.approx(lower)
+            assert alarms[i] == alarm
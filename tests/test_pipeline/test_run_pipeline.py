@@ -0,0 +1,108 @@
+"""Integration test: run the full pipeline script against in-memory SQLite."""
+
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.db.models import (
+    Base,
+    CheckFrequency,
+    ConfidenceLevel,
+    Event,
+    EventStatus,
+    EventType,
+    IndexSnapshot,
+    IndexType,
+    Jurisdiction,
+    LaneHealth,
+    LaneStatus,
+    OsintSource,
+    SourceLayer,
+    TradeLane,
+)
+from src.pipeline.attribution import pathway_mask
+
+WEEK_START = date(2026, 2, 16)  # Monday
+
+
+def _event(lane_id: int, source_id: int, pathway: str, masked: bool) -> Event:
+    return Event(
+        trade_lane_id=lane_id,
+        source_id=source_id,
+        date_observed=WEEK_START,
+        source_layer=SourceLayer.PRIMARY,
+        source_name="DGFT (India) Notifications",
+        source_url="https://dgft.gov.in/",
+        event_type=EventType.REGULATION,
+        jurisdiction=Jurisdiction.INDIA,
+        sector="Textiles",
+        affected_object="Cotton exports",
+        event_description="Export policy amendment",
+        event_status=EventStatus.ENFORCED,
+        confidence_level=ConfidenceLevel.HIGH,
+        historical_precedent=True,
+        impact_pathway=pathway,
+        pathway_mask=pathway_mask(pathway) if masked else None,
+        quant_metric_triggered="Policy change",
+        index_impact=IndexType.RPI,
+        index_delta=1,
+    )
+
+
+async def test_run_pipeline_persists_snapshots_and_health(monkeypatch):
+    """End-to-end run over seeded events, covering both pathway-mask paths."""
+    from scripts.run_pipeline import run_pipeline
+
+    import src.db.session as db_session
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(db_session, "async_session", factory)
+
+    async with factory() as session:
+        lane = TradeLane(name="UK-India", sector="Textiles", status=LaneStatus.ACTIVE)
+        session.add(lane)
+        await session.flush()
+        source = OsintSource(
+            trade_lane_id=lane.id,
+            name="DGFT (India) Notifications",
+            url="https://dgft.gov.in/",
+            source_layer=SourceLayer.PRIMARY,
+            primary_index=IndexType.RPI,
+            check_frequency=CheckFrequency.DAILY,
+            source_weight=1.0,
+        )
+        session.add(source)
+        await session.flush()
+        # One event with a packed pathway mask, one without (free-text path).
+        session.add(_event(lane.id, source.id, "Compliance;Time", masked=True))
+        session.add(_event(lane.id, source.id, "Compliance", masked=False))
+        lane_id = lane.id
+        await session.commit()
+
+    await run_pipeline("UK-India", week_start=WEEK_START)
+
+    async with factory() as session:
+        health = (
+            await session.execute(
+                select(LaneHealth).where(LaneHealth.trade_lane_id == lane_id)
+            )
+        ).scalar_one()
+        assert health.rpi_total == 2
+        assert health.combined_total == 2
+
+        snapshots = (
+            (await session.execute(select(IndexSnapshot))).scalars().all()
+        )
+        assert {s.index_type for s in snapshots} == set(IndexType)
+        rpi = next(s for s in snapshots if s.index_type == IndexType.RPI)
+        assert rpi.weighted_total > 0
+
+    await engine.dispose()
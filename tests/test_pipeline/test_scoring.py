@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.db.models import SourceLayer
+from src.db.models import ConfidenceLevel, EventStatus, SourceLayer
 from src.db.seed import (
     CONFIDENCE_WEIGHTS,
     PRECEDENT_WEIGHTS,
@@ -14,8 +14,8 @@ from src.db.seed import (
 def compute_weighted_score(
     delta: int,
     source_layer: SourceLayer,
-    event_status: str,
-    confidence: str,
+    event_status: EventStatus,
+    confidence: ConfidenceLevel,
     historical_precedent: bool,
 ) -> float:
     """Replicate the weight matrix formula from Danha's sprint plan."""
@@ -33,8 +33,8 @@ def test_dgft_interest_subvention():
     score = compute_weighted_score(
         delta=-1,
         source_layer=SourceLayer.PRIMARY,
-        event_status="Draft",
-        confidence="High",
+        event_status=EventStatus.DRAFT,
+        confidence=ConfidenceLevel.HIGH,
         historical_precedent=True,
     )
     assert score == pytest.approx(-0.36)
@@ -45,8 +45,8 @@ def test_felixstowe_storm():
     score = compute_weighted_score(
         delta=+1,
         source_layer=SourceLayer.LOGISTICS,
-        event_status="Enforced",
-        confidence="High",
+        event_status=EventStatus.ENFORCED,
+        confidence=ConfidenceLevel.HIGH,
         historical_precedent=True,
     )
     assert score == pytest.approx(0.72)
@@ -57,28 +57,61 @@ def test_novel_event_gets_higher_weight():
     novel = compute_weighted_score(
         delta=+1,
         source_layer=SourceLayer.PRIMARY,
-        event_status="Announced",
-        confidence="High",
+        event_status=EventStatus.ANNOUNCED,
+        confidence=ConfidenceLevel.HIGH,
         historical_precedent=False,
     )
     known = compute_weighted_score(
         delta=+1,
         source_layer=SourceLayer.PRIMARY,
-        event_status="Announced",
-        confidence="High",
+        event_status=EventStatus.ANNOUNCED,
+        confidence=ConfidenceLevel.HIGH,
         historical_precedent=True,
     )
     assert novel > known
     assert novel / known == pytest.approx(1.2)
 
 
+def test_batch_kernel_matches_scalar_formula():
+    """The vectorized batch kernel agrees with the scalar weight matrix."""
+    import itertools
+
+    import numpy as np
+
+    from src.pipeline.scoring import (
+        CONFIDENCE_CODES,
+        EVENT_STATUS_CODES,
+        SOURCE_LAYER_CODES,
+        compute_weighted_scores_batch,
+    )
+
+    combos = list(
+        itertools.product(
+            (-1, 0, 1), SourceLayer, EventStatus, ConfidenceLevel, (False, True)
+        )
+    )
+    scores = compute_weighted_scores_batch(
+        np.array([c[0] for c in combos], dtype=np.float64),
+        np.array([SOURCE_LAYER_CODES[c[1]] for c in combos]),
+        np.array([EVENT_STATUS_CODES[c[2]] for c in combos]),
+        np.array([CONFIDENCE_CODES[c[3]] for c in combos]),
+        np.array([int(c[4]) for c in combos]),
+    )
+
+    for (delta, layer, status, confidence, precedent), score in zip(combos, scores):
+        expected = compute_weighted_score(
+            delta, layer, status, confidence, precedent
+        )
+        assert score == pytest.approx(expected)
+
+
 def test_low_confidence_industry_draft():
     """Low confidence + Industry + Draft = minimal weight."""
     score = compute_weighted_score(
         delta=+1,
         source_layer=SourceLayer.INDUSTRY,
-        event_status="Draft",
-        confidence="Low",
+        event_status=EventStatus.DRAFT,
+        confidence=ConfidenceLevel.LOW,
         historical_precedent=True,
     )
     # 1 × 0.6 × 0.4 × 0.3 × 1.0 = 0.072